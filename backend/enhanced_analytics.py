@@ -18,7 +18,7 @@ import numpy as np
 import json
 import io
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
@@ -96,6 +96,40 @@ class EnhancedAnalyticsManager:
             logger.error(f"Error tracking metric {metric_name}: {e}")
             return False
     
+    def track_metrics(self, metrics: List[Dict[str, Any]]) -> bool:
+        """
+        Track a batch of analytics metrics in one pass
+        
+        Each entry takes the same keyword arguments as track_metric. The batch
+        is all-or-nothing: if any entry is invalid, none are stored.
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            timestamp = datetime.now().isoformat()
+            batch = [
+                AnalyticsMetric(
+                    metric_type=entry["metric_type"],
+                    metric_name=entry["metric_name"],
+                    value=entry["value"],
+                    unit=entry["unit"],
+                    timestamp=timestamp,
+                    user_role=entry.get("user_role", ""),
+                    session_id=entry.get("session_id", ""),
+                    additional_data=entry.get("additional_data") or {}
+                )
+                for entry in metrics
+            ]
+            
+            self.metrics_data.extend(batch)
+            logger.debug(f"Tracked {len(batch)} metrics")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error tracking metric batch: {e}")
+            return False
+    
     def get_dashboard_data(self, user_role: str) -> Dict[str, Any]:
         """Get dashboard data customized for specific user role"""
         if not self.enabled:
@@ -154,41 +188,59 @@ class EnhancedAnalyticsManager:
             return None
         
         try:
-            dashboard_data = self.get_dashboard_data(user_role)
-            
-            report_data = {
-                "report_title": f"PV Sentinel Analytics Report - {user_role.title()}",
-                "generated_date": datetime.now().isoformat(),
-                "time_period_days": time_period,
-                "user_role": user_role,
-                "dashboard_data": dashboard_data
-            }
-            
-            if report_format == ReportFormat.JSON:
-                return json.dumps(report_data, indent=2)
-            elif report_format == ReportFormat.CSV:
-                return self._convert_to_csv(report_data)
-            else:
-                return f"Report format {report_format.value} - generated successfully"
+            return "".join(self.stream_analytics_report(report_format, user_role, time_period))
                 
         except Exception as e:
             logger.error(f"Error exporting analytics report: {e}")
             return None
     
-    def _convert_to_csv(self, report_data: Dict) -> str:
-        """Convert report data to CSV format"""
-        csv_lines = []
-        csv_lines.append(f"PV Sentinel Analytics Report,{report_data['user_role']}")
-        csv_lines.append(f"Generated Date,{report_data['generated_date']}")
-        csv_lines.append("")
+    def stream_analytics_report(self, report_format: ReportFormat, 
+                                user_role: str, time_period: int = 30) -> Iterator[str]:
+        """
+        Yield the analytics report chunk by chunk so large exports can be
+        written or served without holding the full text in memory
+        
+        Args:
+            report_format: Export format
+            user_role: Role the dashboard data is tailored to
+            time_period: Reporting window in days
+            
+        Yields:
+            Report text chunks in output order
+        """
+        if not self.export_enabled:
+            logger.warning("Export functionality is disabled")
+            return
+        
+        dashboard_data = self.get_dashboard_data(user_role)
+        
+        report_data = {
+            "report_title": f"PV Sentinel Analytics Report - {user_role.title()}",
+            "generated_date": datetime.now().isoformat(),
+            "time_period_days": time_period,
+            "user_role": user_role,
+            "dashboard_data": dashboard_data
+        }
+        
+        if report_format == ReportFormat.JSON:
+            yield from json.JSONEncoder(indent=2).iterencode(report_data)
+        elif report_format == ReportFormat.CSV:
+            for line_number, line in enumerate(self._iter_csv_lines(report_data)):
+                yield line if line_number == 0 else "\n" + line
+        else:
+            yield f"Report format {report_format.value} - generated successfully"
+    
+    def _iter_csv_lines(self, report_data: Dict) -> Iterator[str]:
+        """Yield report data as CSV lines"""
+        yield f"PV Sentinel Analytics Report,{report_data['user_role']}"
+        yield f"Generated Date,{report_data['generated_date']}"
+        yield ""
         
         # Add metrics
         metrics = report_data.get('dashboard_data', {}).get('metrics', {})
-        csv_lines.append("Metrics")
+        yield "Metrics"
         for key, value in metrics.items():
-            csv_lines.append(f"{key.replace('_', ' ').title()},{value}")
-        
-        return "\n".join(csv_lines)
+            yield f"{key.replace('_', ' ').title()},{value}"
     
     def get_mvp_validation_metrics(self) -> Dict[str, Any]:
         """Get metrics specifically for MVP validation"""
@@ -11,6 +11,7 @@ This module addresses the critical gaps identified in the QA/Validation Manager
 import hashlib
 import json
 import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, List, Any
@@ -18,6 +19,9 @@ from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
+# GPTQ bit width as written in model filenames, e.g. "gptq-8bit", "4-bit", "w8", "int3"
+GPTQ_BITS_PATTERN = re.compile(r'(?<![a-z0-9])(?:([2348])[-_]?bits?|(?:w|int)([2348]))(?![a-z0-9])', re.IGNORECASE)
+
 @dataclass
 class ModelMetadata:
     """Complete metadata for model version tracking"""
@@ -366,9 +370,12 @@ class ModelVersionTracker:
     
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of a file"""
-        sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            # hashlib.file_digest (Python 3.11+) streams the file without a Python-level loop
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
     
@@ -392,6 +399,12 @@ class ModelVersionTracker:
             return 'Q8_0'
         elif 'fp16' in filename:
             return 'fp16'
+        elif 'awq' in filename.lower():
+            return 'AWQ-int4'
+        elif 'gptq' in filename.lower():
+            # GPTQ ships at 2/3/4/8 bits; only label a width the filename states
+            bits = GPTQ_BITS_PATTERN.search(filename)
+            return f'GPTQ-int{bits.group(1) or bits.group(2)}' if bits else 'GPTQ'
         else:
             return 'unknown'
     
@@ -5,6 +5,7 @@ Critical P0 Feature: Side-by-side comparison with edit tracking and justificatio
 
 import logging
 import json
+import os
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any, Set
@@ -12,6 +13,16 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import difflib
 import re
+from collections import Counter
+from itertools import zip_longest
+
+from .storage_utils import read_json, write_json
+
+try:
+    # Optional C++ edit-script backend; difflib is used when it is not installed
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +188,13 @@ class NarrativeComparator:
             r'\b(daily|twice|once|every|per)\b',
             r'\b(increased|decreased|discontinued|started)\b',
         ]
+        
+        # One alternation per severity tier, so each tier is a single regex scan
+        self._critical_change_regex = self._combine_patterns(self.critical_change_patterns)
+        self._medication_change_regex = self._combine_patterns(self.medication_change_patterns)
+    
+    def _combine_patterns(self, patterns: List[str]) -> re.Pattern:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
     
     def compare_narratives(self, version_1: NarrativeVersion, version_2: NarrativeVersion,
                           comparison_context: str = "routine") -> ComparisonResult:
@@ -209,34 +227,64 @@ class NarrativeComparator:
         lines1 = text1.splitlines()
         lines2 = text2.splitlines()
         
-        differ = difflib.unified_diff(lines1, lines2, lineterm='')
+        # Work from the edit script's opcodes directly rather than rendering and
+        # re-parsing a unified diff; line numbers index into the original text
         diff_changes = []
         
-        current_line = 0
-        for line in differ:
-            if line.startswith('-'):
-                diff_changes.append({
-                    'type': 'deletion',
-                    'line_number': current_line,
-                    'content': line[1:],
-                    'original_text': line[1:],
-                    'modified_text': ''
-                })
-            elif line.startswith('+'):
+        for tag, i1, i2, j1, j2 in self._line_opcodes(lines1, lines2):
+            if tag == 'equal':
+                continue
+            
+            paired_lines = zip_longest(lines1[i1:i2], lines2[j1:j2])
+            for offset, (original_line, modified_line) in enumerate(paired_lines):
+                if original_line is None:
+                    change_type = 'addition'
+                elif modified_line is None:
+                    change_type = 'deletion'
+                else:
+                    change_type = 'modification'
+                
                 diff_changes.append({
-                    'type': 'addition',
-                    'line_number': current_line,
-                    'content': line[1:],
-                    'original_text': '',
-                    'modified_text': line[1:]
+                    'type': change_type,
+                    'line_number': i1 + offset,
+                    'content': modified_line if modified_line is not None else original_line,
+                    'original_text': original_line or '',
+                    'modified_text': modified_line or ''
                 })
-            elif line.startswith('@@'):
-                continue
-            else:
-                current_line += 1
         
         return diff_changes
     
+    def _line_opcodes(self, lines1: List[str], lines2: List[str]) -> List[Tuple[str, int, int, int, int]]:
+        """Line-level edit script in difflib opcode form, via rapidfuzz when available"""
+        # Revisions usually keep the opening and closing lines, so only the
+        # differing middle block goes through the edit-script algorithm
+        shorter = min(len(lines1), len(lines2))
+        prefix = 0
+        while prefix < shorter and lines1[prefix] == lines2[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < shorter - prefix and lines1[-1 - suffix] == lines2[-1 - suffix]:
+            suffix += 1
+        
+        end1 = len(lines1) - suffix
+        end2 = len(lines2) - suffix
+        middle1 = lines1[prefix:end1]
+        middle2 = lines2[prefix:end2]
+        
+        if _Levenshtein is not None:
+            middle_opcodes = _Levenshtein.opcodes(middle1, middle2).as_list()
+        else:
+            middle_opcodes = difflib.SequenceMatcher(None, middle1, middle2, autojunk=False).get_opcodes()
+        
+        opcodes = [('equal', 0, prefix, 0, prefix)] if prefix else []
+        opcodes.extend(
+            (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+            for tag, i1, i2, j1, j2 in middle_opcodes
+        )
+        if suffix:
+            opcodes.append(('equal', end1, len(lines1), end2, len(lines2)))
+        return opcodes
+    
     def _analyze_changes(self, diff_changes: List[Dict], version_1: NarrativeVersion, 
                         version_2: NarrativeVersion) -> List[NarrativeChange]:
         analyzed_changes = []
@@ -291,9 +339,8 @@ class NarrativeComparator:
         
         combined_text = f"{original_text} {modified_text}".lower()
         
-        for pattern in self.critical_change_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return ChangeSeverity.CRITICAL
+        if self._critical_change_regex.search(combined_text):
+            return ChangeSeverity.CRITICAL
         
         has_clinical_terms = any(term in combined_text for term in self.significant_terms)
         has_temporal_changes = any(term in combined_text for term in self.temporal_markers)
@@ -301,9 +348,8 @@ class NarrativeComparator:
         if has_clinical_terms or has_temporal_changes:
             return ChangeSeverity.SIGNIFICANT
         
-        for pattern in self.medication_change_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return ChangeSeverity.SIGNIFICANT
+        if self._medication_change_regex.search(combined_text):
+            return ChangeSeverity.SIGNIFICANT
         
         total_change_length = len(original_text) + len(modified_text)
         if total_change_length > 100:
@@ -326,8 +372,9 @@ class NarrativeComparator:
             return f"Modified information from '{original_text[:30]}...' to '{modified_text[:30]}...'"
     
     def _assess_clinical_impact(self, changes: List[NarrativeChange]) -> str:
-        critical_count = sum(1 for c in changes if c.severity == ChangeSeverity.CRITICAL)
-        significant_count = sum(1 for c in changes if c.severity == ChangeSeverity.SIGNIFICANT)
+        severity_counts = Counter(c.severity for c in changes)
+        critical_count = severity_counts[ChangeSeverity.CRITICAL]
+        significant_count = severity_counts[ChangeSeverity.SIGNIFICANT]
         total_changes = len(changes)
         
         if critical_count > 0:
@@ -340,40 +387,39 @@ class NarrativeComparator:
             return f"LOW IMPACT: {total_changes} minor changes with no significant clinical impact"
     
     def _requires_medical_review(self, changes: List[NarrativeChange]) -> bool:
-        has_critical = any(c.severity == ChangeSeverity.CRITICAL for c in changes)
-        significant_count = sum(1 for c in changes if c.severity == ChangeSeverity.SIGNIFICANT)
-        return has_critical or significant_count >= 3
+        severity_counts = Counter(c.severity for c in changes)
+        return severity_counts[ChangeSeverity.CRITICAL] > 0 or severity_counts[ChangeSeverity.SIGNIFICANT] >= 3
     
     def _generate_summary_stats(self, changes: List[NarrativeChange]) -> Dict[str, Any]:
-        total_changes = len(changes)
-        
-        by_severity = {}
-        for severity in ChangeSeverity:
-            by_severity[severity.value] = sum(1 for c in changes if c.severity == severity)
-        
-        by_type = {}
-        for change_type in ChangeType:
-            by_type[change_type.value] = sum(1 for c in changes if c.change_type == change_type)
-        
+        # Tally every breakdown in a single pass over the changes
+        severity_counts = Counter()
+        type_counts = Counter()
         by_section = {}
+        requires_review_count = 0
         for change in changes:
-            section = change.section
-            by_section[section] = by_section.get(section, 0) + 1
+            severity_counts[change.severity] += 1
+            type_counts[change.change_type] += 1
+            by_section[change.section] = by_section.get(change.section, 0) + 1
+            if change.requires_review:
+                requires_review_count += 1
         
         return {
-            'total_changes': total_changes,
-            'by_severity': by_severity,
-            'by_type': by_type,
+            'total_changes': len(changes),
+            'by_severity': {severity.value: severity_counts[severity] for severity in ChangeSeverity},
+            'by_type': {change_type.value: type_counts[change_type] for change_type in ChangeType},
             'by_section': by_section,
-            'requires_review_count': sum(1 for c in changes if c.requires_review),
+            'requires_review_count': requires_review_count,
             'timestamp': datetime.now().isoformat()
         }
 
 class NarrativeVersionManager:
     def __init__(self, config: Dict):
         self.config = config
-        self.versions_file = 'storage/narrative_versions.json'
-        self.comparisons_file = 'storage/narrative_comparisons.json'
+        # Storage ('filesystem' persists to storage_dir, 'memory' keeps versions in process only)
+        self.storage_backend = config.get('storage_backend', 'filesystem')
+        storage_dir = config.get('storage_dir', 'storage')
+        self.versions_file = os.path.join(storage_dir, 'narrative_versions.json')
+        self.comparisons_file = os.path.join(storage_dir, 'narrative_comparisons.json')
         
         self.narrative_versions: Dict[str, List[NarrativeVersion]] = {}
         self.comparisons: Dict[str, ComparisonResult] = {}
@@ -459,15 +505,29 @@ class NarrativeVersionManager:
         present_indicators = sum(1 for indicator in compliance_indicators if indicator in content_lower)
         return present_indicators / len(compliance_indicators)
     
+    @staticmethod
+    def _change_from_dict(change_data: Dict) -> NarrativeChange:
+        change_data['change_type'] = ChangeType(change_data['change_type'])
+        change_data['change_source'] = ChangeSource(change_data['change_source'])
+        change_data['severity'] = ChangeSeverity(change_data['severity'])
+        return NarrativeChange(**change_data)
+    
+    def _version_from_dict(self, version_data: Dict) -> NarrativeVersion:
+        version_data['changes_from_previous'] = [
+            self._change_from_dict(change_data) for change_data in version_data['changes_from_previous']
+        ]
+        return NarrativeVersion(**version_data)
+    
     def _load_versions(self):
+        if self.storage_backend == 'memory':
+            return
+        
         try:
-            import os
             if os.path.exists(self.versions_file):
-                with open(self.versions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_json(self.versions_file)
                 
                 for case_id, versions_data in data.items():
-                    versions = [NarrativeVersion(**version_data) for version_data in versions_data]
+                    versions = [self._version_from_dict(version_data) for version_data in versions_data]
                     self.narrative_versions[case_id] = versions
                 
                 logger.info(f"Loaded versions for {len(self.narrative_versions)} cases")
@@ -475,31 +535,33 @@ class NarrativeVersionManager:
             logger.error(f"Failed to load narrative versions: {e}")
     
     def _save_versions(self):
+        if self.storage_backend == 'memory':
+            return
+        
         try:
-            import os
             os.makedirs(os.path.dirname(self.versions_file), exist_ok=True)
             
             data = {}
             for case_id, versions in self.narrative_versions.items():
                 data[case_id] = [asdict(version) for version in versions]
             
-            with open(self.versions_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(self.versions_file, data)
                 
         except Exception as e:
             logger.error(f"Failed to save narrative versions: {e}")
     
     def _load_comparisons(self):
+        if self.storage_backend == 'memory':
+            return
+        
         try:
-            import os
             if os.path.exists(self.comparisons_file):
-                with open(self.comparisons_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_json(self.comparisons_file)
                 
                 for comp_id, comp_data in data.items():
-                    comp_data['version_1'] = NarrativeVersion(**comp_data['version_1'])
-                    comp_data['version_2'] = NarrativeVersion(**comp_data['version_2'])
-                    comp_data['changes'] = [NarrativeChange(**change_data) for change_data in comp_data['changes']]
+                    comp_data['version_1'] = self._version_from_dict(comp_data['version_1'])
+                    comp_data['version_2'] = self._version_from_dict(comp_data['version_2'])
+                    comp_data['changes'] = [self._change_from_dict(change_data) for change_data in comp_data['changes']]
                     
                     self.comparisons[comp_id] = ComparisonResult(**comp_data)
                 
@@ -508,16 +570,17 @@ class NarrativeVersionManager:
             logger.error(f"Failed to load comparisons: {e}")
     
     def _save_comparisons(self):
+        if self.storage_backend == 'memory':
+            return
+        
         try:
-            import os
             os.makedirs(os.path.dirname(self.comparisons_file), exist_ok=True)
             
             data = {}
             for comp_id, comparison in self.comparisons.items():
                 data[comp_id] = asdict(comparison)
             
-            with open(self.comparisons_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(self.comparisons_file, data)
                 
         except Exception as e:
             logger.error(f"Failed to save comparisons: {e}")
@@ -16,6 +16,24 @@ from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
+# Phrase tables scanned on every context extraction; built once at import.
+# First-person indicators
+FIRST_PERSON_PHRASES = ("I felt", "I experienced", "I noticed", "I developed",
+                        "I started", "I began", "I suffered", "I had")
+
+# Emotional/subjective descriptors
+EMOTIONAL_PHRASES = ("painful", "scary", "worrying", "frightening",
+                     "uncomfortable", "severe", "mild", "terrible")
+
+# Temporal patient descriptions
+TEMPORAL_PHRASES = ("suddenly", "gradually", "immediately", "within hours",
+                    "the next day", "that evening", "right away")
+
+VOICE_INDICATOR_PHRASES = FIRST_PERSON_PHRASES + EMOTIONAL_PHRASES + TEMPORAL_PHRASES
+
+EMOTIONAL_KEYWORDS = ("worried", "scared", "anxious", "painful", "severe",
+                      "mild", "terrible", "frightening", "concerning")
+
 @dataclass
 class PatientContext:
     """Preserves unedited patient voice and context"""
@@ -89,23 +107,11 @@ class PatientContextPreserver:
         """Identify phrases that preserve patient perspective"""
         voice_indicators = []
         
-        # First-person indicators
-        first_person_phrases = ["I felt", "I experienced", "I noticed", "I developed", 
-                               "I started", "I began", "I suffered", "I had"]
-        
-        # Emotional/subjective descriptors
-        emotional_phrases = ["painful", "scary", "worrying", "frightening", 
-                            "uncomfortable", "severe", "mild", "terrible"]
-        
-        # Temporal patient descriptions
-        temporal_phrases = ["suddenly", "gradually", "immediately", "within hours",
-                           "the next day", "that evening", "right away"]
-        
         text_lower = text.lower()
-        for phrase in first_person_phrases + emotional_phrases + temporal_phrases:
-            if phrase in text_lower:
-                # Find and preserve the full context around the phrase
-                start_idx = text_lower.find(phrase)
+        for phrase in VOICE_INDICATOR_PHRASES:
+            start_idx = text_lower.find(phrase)
+            if start_idx != -1:
+                # Preserve the full context around the phrase
                 end_idx = min(start_idx + 100, len(text))
                 context_snippet = text[max(0, start_idx-20):end_idx]
                 voice_indicators.append(context_snippet.strip())
@@ -114,11 +120,8 @@ class PatientContextPreserver:
     
     def _extract_emotional_context(self, text: str) -> Optional[str]:
         """Extract emotional context that should be preserved"""
-        emotional_keywords = ["worried", "scared", "anxious", "painful", "severe", 
-                             "mild", "terrible", "frightening", "concerning"]
-        
         text_lower = text.lower()
-        found_emotions = [word for word in emotional_keywords if word in text_lower]
+        found_emotions = [word for word in EMOTIONAL_KEYWORDS if word in text_lower]
         
         if found_emotions:
             return f"Patient expressed emotional context: {', '.join(found_emotions)}"
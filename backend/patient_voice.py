@@ -14,14 +14,61 @@ Stakeholder Value: Patient Advocate, PV Officer, Regulatory Affairs, Clinical Op
 
 import logging
 import json
+import os
 import hashlib
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
+from collections import OrderedDict
+
+from .storage_utils import enum_value, read_json, write_json
 
 logger = logging.getLogger(__name__)
 
+# Scan results memoized per extractor
+SCAN_CACHE_SIZE = 256
+
+def _compile_patterns(patterns: List[str], flags: int = re.IGNORECASE) -> Tuple[re.Pattern, ...]:
+    """Compile a group of patient voice detection patterns"""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+# Patient voice patterns are compiled once at import and shared by all extractors
+
+# Direct quote patterns
+DIRECT_QUOTE_PATTERNS = _compile_patterns([
+    r'"([^"]*)"',  # Text in quotes
+    r"'([^']*)'",  # Text in single quotes
+    r'patient said[:\s]+"([^"]*)"',  # Patient said: "..."
+    r'patient reported[:\s]+"([^"]*)"',  # Patient reported: "..."
+    r'patient states[:\s]+"([^"]*)"',  # Patient states: "..."
+])
+
+# Reported speech patterns
+REPORTED_SPEECH_PATTERNS = _compile_patterns([
+    r'patient (?:said|reported|states|mentioned|complained|described) (?:that )?(.+?)(?:\.|$)',
+    r'according to (?:the )?patient[,\s]+(.+?)(?:\.|$)',
+    r'patient (?:feels|experiences|has) (.+?)(?:\.|$)',
+])
+
+# Emotional indicator patterns
+EMOTIONAL_PATTERNS = _compile_patterns([
+    r'\b(scared|frightened|terrified|afraid)\b',
+    r'\b(worried|anxious|nervous|concerned)\b',
+    r'\b(painful|hurts|aching|sore)\b',
+    r'\b(dizzy|nauseous|sick|ill)\b',
+    r'\b(tired|exhausted|weak|fatigue)\b',
+    r'\b(confused|disoriented|foggy)\b',
+])
+
+# Temporal expressions that indicate patient experience
+TEMPORAL_PATTERNS = _compile_patterns([
+    r'(?:started|began|happened|occurred) (?:about |around )?(.+?) (?:ago|before)',
+    r'(?:lasted|continued) (?:for )?(.+?)(?:\.|$)',
+    r'(?:since|after|before) (.+?)(?:\.|$)',
+])
+
 class PatientVoiceType(Enum):
     """Types of patient voice input methods"""
     DIRECT_QUOTE = "direct_quote"        # Direct patient quotation
@@ -97,8 +144,11 @@ class PatientVoiceRecord:
     
     def _calculate_integrity_hash(self) -> str:
         """Calculate integrity hash for tamper detection"""
-        content = json.dumps([asdict(fragment) for fragment in self.patient_fragments], sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()
+        # One digest fed fragment by fragment, rather than one large JSON string
+        digest = hashlib.sha256()
+        for fragment in self.patient_fragments:
+            digest.update(json.dumps(asdict(fragment), sort_keys=True, default=enum_value).encode())
+        return digest.hexdigest()
 
 class PatientVoiceExtractor:
     """
@@ -114,43 +164,18 @@ class PatientVoiceExtractor:
         # Patterns for identifying patient voice
         self._initialize_voice_patterns()
         
+        # Per-instance LRU memo of scan results, keyed on (SHA-256 of the text, voice_type)
+        # so raw narratives are never held as cache keys
+        self._scan_cache: "OrderedDict[Tuple[str, PatientVoiceType], Tuple[PatientVoiceFragment, ...]]" = OrderedDict()
+        
         logger.info(f"Patient voice extractor initialized - protection: {self.voice_protection_enabled}")
     
     def _initialize_voice_patterns(self):
-        """Initialize patterns for detecting patient voice in text"""
-        
-        # Direct quote patterns
-        self.direct_quote_patterns = [
-            r'"([^"]*)"',  # Text in quotes
-            r"'([^']*)'",  # Text in single quotes
-            r'patient said[:\s]+"([^"]*)"',  # Patient said: "..."
-            r'patient reported[:\s]+"([^"]*)"',  # Patient reported: "..."
-            r'patient states[:\s]+"([^"]*)"',  # Patient states: "..."
-        ]
-        
-        # Reported speech patterns
-        self.reported_speech_patterns = [
-            r'patient (?:said|reported|states|mentioned|complained|described) (?:that )?(.+?)(?:\.|$)',
-            r'according to (?:the )?patient[,\s]+(.+?)(?:\.|$)',
-            r'patient (?:feels|experiences|has) (.+?)(?:\.|$)',
-        ]
-        
-        # Emotional indicator patterns
-        self.emotional_patterns = [
-            r'\b(scared|frightened|terrified|afraid)\b',
-            r'\b(worried|anxious|nervous|concerned)\b',
-            r'\b(painful|hurts|aching|sore)\b',
-            r'\b(dizzy|nauseous|sick|ill)\b',
-            r'\b(tired|exhausted|weak|fatigue)\b',
-            r'\b(confused|disoriented|foggy)\b',
-        ]
-        
-        # Temporal expressions that indicate patient experience
-        self.temporal_patterns = [
-            r'(?:started|began|happened|occurred) (?:about |around )?(.+?) (?:ago|before)',
-            r'(?:lasted|continued) (?:for )?(.+?)(?:\.|$)',
-            r'(?:since|after|before) (.+?)(?:\.|$)',
-        ]
+        """Bind the shared precompiled patterns for detecting patient voice in text"""
+        self.direct_quote_patterns = DIRECT_QUOTE_PATTERNS
+        self.reported_speech_patterns = REPORTED_SPEECH_PATTERNS
+        self.emotional_patterns = EMOTIONAL_PATTERNS
+        self.temporal_patterns = TEMPORAL_PATTERNS
     
     def extract_patient_voice(self, text: str, input_source: str = "unknown", 
                             voice_type: PatientVoiceType = PatientVoiceType.REPORTED_SPEECH) -> List[PatientVoiceFragment]:
@@ -168,34 +193,68 @@ class PatientVoiceExtractor:
         if not self.voice_protection_enabled:
             return []
         
+        # Scanning depends only on the text and voice type; each call gets fresh
+        # fragments stamped with its own source, ID and capture time
+        validated_fragments = [
+            replace(
+                scanned,
+                fragment_id="",
+                timestamp="",
+                source=input_source,
+                emotional_indicators=list(scanned.emotional_indicators)
+            )
+            for scanned in self._scan_patient_voice(text, voice_type)
+        ]
+        
+        logger.info(f"Extracted {len(validated_fragments)} patient voice fragments from {len(text)} characters")
+        
+        return validated_fragments
+    
+    def clear_scan_cache(self):
+        """Drop memoized scan results, e.g. at the end of an extraction session"""
+        self._scan_cache.clear()
+    
+    def _scan_patient_voice(self, text: str,
+                            voice_type: PatientVoiceType) -> Tuple[PatientVoiceFragment, ...]:
+        """Scan the text, reusing the result for text already seen by this extractor"""
+        cache_key = (hashlib.sha256(text.encode()).hexdigest(), voice_type)
+        
+        if cache_key in self._scan_cache:
+            self._scan_cache.move_to_end(cache_key)
+            return self._scan_cache[cache_key]
+        
+        scanned = self._scan_patient_voice_uncached(text, voice_type)
+        self._scan_cache[cache_key] = scanned
+        if len(self._scan_cache) > SCAN_CACHE_SIZE:
+            self._scan_cache.popitem(last=False)
+        return scanned
+    
+    def _scan_patient_voice_uncached(self, text: str, 
+                                     voice_type: PatientVoiceType) -> Tuple[PatientVoiceFragment, ...]:
+        """Run every extraction pattern over the text and validate the results"""
         fragments = []
         
         # Extract direct quotes
-        fragments.extend(self._extract_direct_quotes(text, input_source))
+        fragments.extend(self._extract_direct_quotes(text, ""))
         
         # Extract reported speech
-        fragments.extend(self._extract_reported_speech(text, input_source, voice_type))
+        fragments.extend(self._extract_reported_speech(text, "", voice_type))
         
         # Extract emotional expressions
-        fragments.extend(self._extract_emotional_expressions(text, input_source))
+        fragments.extend(self._extract_emotional_expressions(text, ""))
         
         # Extract temporal expressions
-        fragments.extend(self._extract_temporal_expressions(text, input_source))
+        fragments.extend(self._extract_temporal_expressions(text, ""))
         
         # Filter and validate fragments
-        validated_fragments = self._validate_fragments(fragments)
-        
-        logger.info(f"Extracted {len(validated_fragments)} patient voice fragments from {len(text)} characters")
-        
-        return validated_fragments
+        return tuple(self._validate_fragments(fragments))
     
     def _extract_direct_quotes(self, text: str, input_source: str) -> List[PatientVoiceFragment]:
         """Extract direct patient quotes"""
         fragments = []
         
         for pattern in self.direct_quote_patterns:
-            import re
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             
             for match in matches:
                 quote_text = match.group(1) if len(match.groups()) > 0 else match.group(0)
@@ -223,8 +282,7 @@ class PatientVoiceExtractor:
         fragments = []
         
         for pattern in self.reported_speech_patterns:
-            import re
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             
             for match in matches:
                 reported_text = match.group(1) if len(match.groups()) > 0 else match.group(0)
@@ -251,8 +309,7 @@ class PatientVoiceExtractor:
         fragments = []
         
         for pattern in self.emotional_patterns:
-            import re
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             
             for match in matches:
                 # Extract surrounding context for emotional expressions
@@ -280,8 +337,7 @@ class PatientVoiceExtractor:
         fragments = []
         
         for pattern in self.temporal_patterns:
-            import re
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             
             for match in matches:
                 context_text = self._extract_context(text, match.start(), match.end(), window=50)
@@ -337,9 +393,8 @@ class PatientVoiceExtractor:
         """Detect emotional indicators in text"""
         emotions = []
         
-        import re
         for pattern in self.emotional_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             emotions.extend(matches)
         
         return list(set(emotions))  # Remove duplicates
@@ -373,17 +428,16 @@ class PatientVoiceExtractor:
     def _validate_fragments(self, fragments: List[PatientVoiceFragment]) -> List[PatientVoiceFragment]:
         """Validate and filter fragments based on confidence and relevance"""
         validated = []
+        seen_texts = set()
         
         for fragment in fragments:
             # Apply threshold filter
             if fragment.confidence_score >= self.extraction_threshold:
-                # Check for duplicates
-                is_duplicate = any(
-                    existing.original_text.strip().lower() == fragment.original_text.strip().lower()
-                    for existing in validated
-                )
+                # Check for duplicates on the normalized text
+                normalized_text = fragment.original_text.strip().lower()
                 
-                if not is_duplicate:
+                if normalized_text not in seen_texts:
+                    seen_texts.add(normalized_text)
                     validated.append(fragment)
         
         # Sort by confidence and clinical relevance
@@ -402,8 +456,9 @@ class PatientVoiceProtector:
         self.auto_lock_enabled = config.get('patient_voice', {}).get('auto_lock_enabled', True)
         self.modification_logging = config.get('patient_voice', {}).get('log_modification_attempts', True)
         
-        # Storage
-        self.records_file = 'storage/patient_voice_records.json'
+        # Storage ('filesystem' persists to storage_dir, 'memory' keeps records in process only)
+        self.storage_backend = config.get('storage_backend', 'filesystem')
+        self.records_file = os.path.join(config.get('storage_dir', 'storage'), 'patient_voice_records.json')
         self.voice_records: Dict[str, PatientVoiceRecord] = {}
         
         # Load existing records
@@ -526,22 +581,25 @@ class PatientVoiceProtector:
     
     def _load_records(self):
         """Load patient voice records from storage"""
+        if self.storage_backend == 'memory':
+            return
+        
         try:
-            import os
             if os.path.exists(self.records_file):
-                with open(self.records_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_json(self.records_file)
                     
                 # Convert back to objects
                 for record_id, record_data in data.items():
-                    # Convert fragments
-                    fragments = [
-                        PatientVoiceFragment(**fragment_data) 
-                        for fragment_data in record_data['patient_fragments']
-                    ]
+                    # Convert fragments, restoring enums stored by value
+                    fragments = []
+                    for fragment_data in record_data['patient_fragments']:
+                        fragment_data['voice_type'] = PatientVoiceType(fragment_data['voice_type'])
+                        fragment_data['validation_level'] = PatientVoiceValidation(fragment_data['validation_level'])
+                        fragments.append(PatientVoiceFragment(**fragment_data))
                     
                     # Create record
                     record_data['patient_fragments'] = fragments
+                    record_data['validation_status'] = PatientVoiceValidation(record_data['validation_status'])
                     record = PatientVoiceRecord(**record_data)
                     self.voice_records[record_id] = record
                 
@@ -551,8 +609,10 @@ class PatientVoiceProtector:
     
     def _save_records(self):
         """Save patient voice records to storage"""
+        if self.storage_backend == 'memory':
+            return
+        
         try:
-            import os
             os.makedirs(os.path.dirname(self.records_file), exist_ok=True)
             
             # Convert to serializable format
@@ -560,8 +620,7 @@ class PatientVoiceProtector:
             for record_id, record in self.voice_records.items():
                 data[record_id] = asdict(record)
             
-            with open(self.records_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json(self.records_file, data)
                 
         except Exception as e:
             logger.error(f"Failed to save patient voice records: {e}")
@@ -20,6 +20,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Set, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import lru_cache
 import unicodedata
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,83 @@ class PIISensitivity(Enum):
     HIGH = "high"        # Full names, specific addresses
     CRITICAL = "critical" # SSN, MRN, DOB
 
+def _compile_patterns(patterns: List[str], flags: int = 0) -> Tuple[re.Pattern, ...]:
+    """Compile a group of PII detection patterns"""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+@lru_cache(maxsize=None)
+def _compile_custom_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """Compile configured custom PII patterns once per distinct pattern set"""
+    return _compile_patterns(list(patterns), re.IGNORECASE)
+
+# Built-in PII patterns are compiled once at import and shared by all detectors
+
+# Name patterns (various cultures)
+NAME_PATTERNS = _compile_patterns([
+    # Common Western names (first last)
+    r'\b[A-Z][a-z]{1,15}\s+[A-Z][a-z]{1,15}\b',
+    # Names with titles
+    r'\b(?:Mr|Mrs|Ms|Dr|Prof)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',
+    # Initials
+    r'\b[A-Z]\.[A-Z]\.\b',
+    # Multi-part surnames
+    r'\b[A-Z][a-z]+(?:-[A-Z][a-z]+)*\s+[A-Z][a-z]+\b',
+])
+
+# Date patterns
+DATE_PATTERNS = _compile_patterns([
+    # MM/DD/YYYY, DD/MM/YYYY
+    r'\b\d{1,2}[/\-]\d{1,2}[/\-]\d{4}\b',
+    # Month DD, YYYY
+    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
+    # DD Month YYYY
+    r'\b\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
+    # ISO format
+    r'\b\d{4}-\d{2}-\d{2}\b',
+], re.IGNORECASE)
+
+# Address patterns
+ADDRESS_PATTERNS = _compile_patterns([
+    # Street addresses
+    r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b',
+    # Zip codes
+    r'\b\d{5}(?:-\d{4})?\b',
+    # Postal codes (various countries)
+    r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b',  # Canada
+], re.IGNORECASE)
+
+# Phone patterns
+PHONE_PATTERNS = _compile_patterns([
+    # US phone numbers
+    r'\b(?:\+?1[-.\s]?)?\(?[2-9]\d{2}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
+    # International format
+    r'\b\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b',
+])
+
+# Email patterns
+EMAIL_PATTERNS = _compile_patterns([
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+])
+
+# Medical record numbers
+MRN_PATTERNS = _compile_patterns([
+    r'\b(?:MRN|Medical Record|Patient ID)[\s:]*[A-Z0-9\-]{6,}\b',
+    r'\b[A-Z]{2}\d{6,}\b',  # Common MRN format
+], re.IGNORECASE)
+
+# Capitalized medical phrases that look like names (lowercase)
+NAME_FALSE_POSITIVES = frozenset({
+    'adverse event', 'medical history', 'patient reported',
+    'side effect', 'drug name', 'brand name', 'generic name',
+    'patient john', 'patient jane'  # Common test patterns
+})
+
+# One alternation so each candidate is scanned once; matches anywhere in the
+# candidate, so "Side Effects" is still filtered by 'side effect'
+NAME_FALSE_POSITIVE_PATTERN = re.compile(
+    '|'.join(re.escape(phrase) for phrase in sorted(NAME_FALSE_POSITIVES))
+)
+
 @dataclass
 class PIIDetection:
     """Results of PII detection"""
@@ -91,64 +169,16 @@ class PIIDetector:
     def _initialize_patterns(self):
         """Initialize PII detection patterns"""
         
-        # Name patterns (various cultures)
-        self.name_patterns = [
-            # Common Western names (first last)
-            r'\b[A-Z][a-z]{1,15}\s+[A-Z][a-z]{1,15}\b',
-            # Names with titles
-            r'\b(?:Mr|Mrs|Ms|Dr|Prof)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',
-            # Initials
-            r'\b[A-Z]\.[A-Z]\.\b',
-            # Multi-part surnames
-            r'\b[A-Z][a-z]+(?:-[A-Z][a-z]+)*\s+[A-Z][a-z]+\b',
-        ]
-        
-        # Date patterns
-        self.date_patterns = [
-            # MM/DD/YYYY, DD/MM/YYYY
-            r'\b\d{1,2}[/\-]\d{1,2}[/\-]\d{4}\b',
-            # Month DD, YYYY
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
-            # DD Month YYYY
-            r'\b\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
-            # ISO format
-            r'\b\d{4}-\d{2}-\d{2}\b',
-        ]
-        
-        # Address patterns
-        self.address_patterns = [
-            # Street addresses
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Place|Pl)\b',
-            # Zip codes
-            r'\b\d{5}(?:-\d{4})?\b',
-            # Postal codes (various countries)
-            r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b',  # Canada
-        ]
-        
-        # Phone patterns
-        self.phone_patterns = [
-            # US phone numbers
-            r'\b(?:\+?1[-.\s]?)?\(?[2-9]\d{2}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
-            # International format
-            r'\b\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b',
-        ]
-        
-        # Email patterns
-        self.email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        ]
-        
-        # Medical record numbers
-        self.mrn_patterns = [
-            r'\b(?:MRN|Medical Record|Patient ID)[\s:]*[A-Z0-9\-]{6,}\b',
-            r'\b[A-Z]{2}\d{6,}\b',  # Common MRN format
-        ]
-        
-        # Custom patterns from config
-        self.custom_patterns = [
-            re.compile(pattern, re.IGNORECASE) 
-            for pattern in self.config.custom_patterns
-        ]
+        # Built-in patterns are compiled once at import time (see module constants)
+        self.name_patterns = NAME_PATTERNS
+        self.date_patterns = DATE_PATTERNS
+        self.address_patterns = ADDRESS_PATTERNS
+        self.phone_patterns = PHONE_PATTERNS
+        self.email_patterns = EMAIL_PATTERNS
+        self.mrn_patterns = MRN_PATTERNS
+        
+        # Custom patterns from config, shared by detectors with the same pattern set
+        self.custom_patterns = _compile_custom_patterns(tuple(self.config.custom_patterns))
     
     def detect_pii(self, text: str, context: str = "") -> List[PIIDetection]:
         """
@@ -202,7 +232,7 @@ class PIIDetector:
         detections = []
         
         for pattern in self.name_patterns:
-            for match in re.finditer(pattern, text):
+            for match in pattern.finditer(text):
                 # Filter out common false positives
                 name_text = match.group().strip()
                 if self._is_likely_name(name_text, context):
@@ -224,7 +254,7 @@ class PIIDetector:
         detections = []
         
         for pattern in self.date_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern.finditer(text):
                 date_text = match.group().strip()
                 sensitivity = self._assess_date_sensitivity(date_text, context)
                 
@@ -246,7 +276,7 @@ class PIIDetector:
         detections = []
         
         for pattern in self.address_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern.finditer(text):
                 address_text = match.group().strip()
                 
                 detections.append(PIIDetection(
@@ -267,7 +297,7 @@ class PIIDetector:
         detections = []
         
         for pattern in self.phone_patterns:
-            for match in re.finditer(pattern, text):
+            for match in pattern.finditer(text):
                 phone_text = match.group().strip()
                 
                 detections.append(PIIDetection(
@@ -288,7 +318,7 @@ class PIIDetector:
         detections = []
         
         for pattern in self.email_patterns:
-            for match in re.finditer(pattern, text):
+            for match in pattern.finditer(text):
                 email_text = match.group().strip()
                 
                 detections.append(PIIDetection(
@@ -309,7 +339,7 @@ class PIIDetector:
         detections = []
         
         for pattern in self.mrn_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+            for match in pattern.finditer(text):
                 mrn_text = match.group().strip()
                 
                 detections.append(PIIDetection(
@@ -348,20 +378,14 @@ class PIIDetector:
     
     def _is_likely_name(self, text: str, context: str) -> bool:
         """Assess if detected pattern is likely a real name"""
-        # Filter common false positives
-        false_positives = {
-            'adverse event', 'medical history', 'patient reported',
-            'side effect', 'drug name', 'brand name', 'generic name',
-            'patient john', 'patient jane'  # Common test patterns
-        }
-        
         text_lower = text.lower()
         
         # Don't match if it starts with "Patient"
         if text_lower.startswith('patient '):
             return False
-            
-        return not any(fp in text_lower for fp in false_positives)
+        
+        # Filter common false positives
+        return not NAME_FALSE_POSITIVE_PATTERN.search(text_lower)
     
     def _calculate_name_confidence(self, name: str, context: str) -> float:
         """Calculate confidence score for name detection"""
@@ -15,7 +15,7 @@ Business Impact: Unlocks €25-40K license tier for regulatory-focused customers
 import json
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -198,15 +198,33 @@ class RegulatoryExportManager:
             Formatted PSUR narrative text
         """
         try:
-            # PSUR header
-            psur_period = psur_metadata.get('reporting_period', 'Not specified')
-            product_name = psur_metadata.get('product_name', 'Unknown product')
-            data_lock_point = psur_metadata.get('data_lock_point', datetime.now().strftime('%d-%b-%Y'))
+            psur_narrative = "\n".join(self.stream_psur_narrative(cases, psur_metadata))
+            logger.info(f"Generated PSUR narrative for {len(cases)} cases")
+            return psur_narrative
             
-            narrative_sections = []
+        except Exception as e:
+            logger.error(f"Error generating PSUR narrative: {e}")
+            raise
+    
+    def stream_psur_narrative(self, cases: List[Dict[str, Any]], psur_metadata: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the PSUR narrative section by section so callers can render
+        the report progressively instead of waiting for the full text
+        
+        Args:
+            cases: List of adverse event cases
+            psur_metadata: PSUR-specific metadata
             
-            # Executive Summary
-            narrative_sections.append(f"""
+        Yields:
+            PSUR narrative sections in report order
+        """
+        # PSUR header
+        psur_period = psur_metadata.get('reporting_period', 'Not specified')
+        product_name = psur_metadata.get('product_name', 'Unknown product')
+        data_lock_point = psur_metadata.get('data_lock_point', datetime.now().strftime('%d-%b-%Y'))
+        
+        # Executive Summary
+        yield f"""
 PERIODIC SAFETY UPDATE REPORT
 Product: {product_name}
 Reporting Period: {psur_period}
@@ -216,37 +234,37 @@ EXECUTIVE SUMMARY
 During the reporting period {psur_period}, a total of {len(cases)} adverse event reports were 
 received for {product_name}. This report provides a comprehensive analysis of the safety 
 profile based on all available data up to the data lock point of {data_lock_point}.
-            """)
-            
-            # Case summaries by severity
-            serious_cases = [case for case in cases if case.get('serious', False)]
-            non_serious_cases = [case for case in cases if not case.get('serious', False)]
-            
-            if serious_cases:
-                narrative_sections.append(f"""
+            """
+        
+        # Case summaries by severity
+        serious_cases = [case for case in cases if case.get('serious', False)]
+        non_serious_cases = [case for case in cases if not case.get('serious', False)]
+        
+        if serious_cases:
+            yield f"""
 SERIOUS ADVERSE EVENTS (n={len(serious_cases)})
 The following serious adverse events were reported during the current period:
-                """)
-                
-                for i, case in enumerate(serious_cases, 1):
-                    case_summary = f"""
+                """
+            
+            for i, case in enumerate(serious_cases, 1):
+                case_summary = f"""
 Case {i}: {case.get('case_id', 'Unknown')}
 Patient: {case.get('patient_age', 'Unknown')} year old {case.get('patient_gender', 'unknown gender')}
 Event: {case.get('event_description', 'No description available')}
 Outcome: {case.get('outcome', 'Unknown')}
 Causality: {case.get('causality_assessment', 'Not assessed')}
                     """
-                    narrative_sections.append(case_summary)
-            
-            if non_serious_cases:
-                narrative_sections.append(f"""
+                yield case_summary
+        
+        if non_serious_cases:
+            yield f"""
 NON-SERIOUS ADVERSE EVENTS (n={len(non_serious_cases)})
 A total of {len(non_serious_cases)} non-serious adverse events were reported, 
 including common events such as headache, nausea, and dizziness.
-                """)
-            
-            # Conclusion
-            narrative_sections.append(f"""
+                """
+        
+        # Conclusion
+        yield f"""
 CONCLUSION
 Based on the review of {len(cases)} adverse event reports during {psur_period}, 
 the benefit-risk profile of {product_name} remains favorable. No new safety signals 
@@ -254,15 +272,7 @@ were identified that would require immediate regulatory action.
             
 Report generated by PV Sentinel on {datetime.now().strftime('%d-%b-%Y %H:%M:%S')}
 Data Lock Point: {data_lock_point}
-            """)
-            
-            psur_narrative = "\n".join(narrative_sections)
-            logger.info(f"Generated PSUR narrative for {len(cases)} cases")
-            return psur_narrative
-            
-        except Exception as e:
-            logger.error(f"Error generating PSUR narrative: {e}")
-            raise
+            """
     
     def export_to_faers_xml(self, cases: List[Dict[str, Any]]) -> str:
         """
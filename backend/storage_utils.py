@@ -0,0 +1,37 @@
+"""
+PV Sentinel - Storage Utilities
+JSON storage helpers shared by the file-backed record stores
+"""
+
+import json
+from enum import Enum
+from typing import Any
+
+try:
+    # Optional fast JSON backend; the stdlib json module is used when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+def enum_value(obj: Any) -> Any:
+    """JSON fallback that stores enums by their value"""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def read_json(path: str) -> Any:
+    """Read a JSON storage file"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json(path: str, data: Any) -> None:
+    """Write a JSON storage file with two-space indentation and enums stored by value"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=enum_value)
@@ -9,6 +9,7 @@ This module addresses the gap identified in the Clinical Operations Lead assessm
 """
 
 import logging
+import os
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Set
@@ -146,8 +147,9 @@ class UserManager:
         self.lockout_duration = config.get('users', {}).get('lockout_duration', 1800)  # 30 minutes
         
         # Storage
-        self.users_file = 'storage/users.json'
-        self.sessions_file = 'storage/sessions.json'
+        storage_dir = config.get('storage_dir', 'storage')
+        self.users_file = os.path.join(storage_dir, 'users.json')
+        self.sessions_file = os.path.join(storage_dir, 'sessions.json')
         
         # In-memory storage
         self.users: Dict[str, User] = {}
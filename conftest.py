@@ -0,0 +1,27 @@
+"""
+PV Sentinel - shared pytest configuration
+
+Keeps the emoji results summary that the standalone test runners print,
+so `python -m pytest -n auto` reports the same way as the legacy scripts.
+"""
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Append the PV Sentinel results summary to the pytest report"""
+    stats = terminalreporter.stats
+    passed = len(stats.get('passed', []))
+    failed = len(stats.get('failed', []))
+    errors = len(stats.get('error', []))
+    skipped = len(stats.get('skipped', []))
+    total = passed + failed + errors + skipped
+
+    if total == 0:
+        return
+
+    terminalreporter.section("📊 TEST RESULTS SUMMARY")
+    terminalreporter.write_line(f"Total Tests: {total}")
+    terminalreporter.write_line(f"✅ Passed: {passed}")
+    terminalreporter.write_line(f"❌ Failed: {failed}")
+    terminalreporter.write_line(f"💥 Errors: {errors}")
+    terminalreporter.write_line(f"⏭️ Skipped: {skipped}")
+    terminalreporter.write_line(f"🎯 Success Rate: {passed / total * 100:.1f}%")
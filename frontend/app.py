@@ -11,40 +11,77 @@ st.set_page_config(
 import sys
 import os
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pandas as pd
+import yaml
 
 # Add the parent directory to the path so we can import backend modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-# Import the correct class names from backend modules
-import_error_message = None
-backend_available = False
-
-try:
-    from backend.patient_context import PatientContextPreserver
-    from backend.model_tracking import ModelVersionTracker
-    from backend.readback import VoiceReadbackConfirmer
-    # Phase 1 imports
-    from backend.pii_protection import create_pii_protector
-    # Phase 2 imports
-    from backend.patient_voice import create_patient_voice_protector
-    from backend.narrative_comparison import create_narrative_comparison_system
-    # Phase 3 imports
-    from backend.ux_enhancement import create_ux_enhancement_system
-    # Phase 4A imports
-    from backend.enhanced_analytics import create_enhanced_analytics_manager
-    from backend.operational_improvements import create_operational_improvements_system
-    # Phase 4B imports - Focus Group Priority Features
-    from backend.regulatory_export import create_regulatory_export_manager
-    from backend.meddra_integration import create_meddra_integration_system
-    from backend.smart_automation import create_smart_automation_system
-    backend_available = True
-except ImportError as e:
-    # Store the error message for later display
-    import_error_message = f"Backend modules not fully available: {e}"
-    backend_available = False
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "config.yaml"
 
-# Custom CSS for better styling
-st.markdown("""
+# Demo adverse event cases used by the export previews
+DEMO_CASES = [
+    {
+        "case_id": "CASE_001",
+        "patient_age": 45,
+        "patient_gender": "female",
+        "event_description": "Severe headache and dizziness after first dose",
+        "serious": False,
+        "outcome": "recovered",
+        "causality_assessment": "Possible"
+    },
+    {
+        "case_id": "CASE_002",
+        "patient_age": 65,
+        "patient_gender": "male",
+        "event_description": "Hospitalized with anaphylactic reaction within 30 minutes of infusion",
+        "serious": True,
+        "outcome": "recovering",
+        "causality_assessment": "Probable"
+    },
+    {
+        "case_id": "CASE_003",
+        "patient_age": 32,
+        "patient_gender": "female",
+        "event_description": "Mild injection site rash resolving over three days",
+        "serious": False,
+        "outcome": "recovered",
+        "causality_assessment": "Related"
+    }
+]
+
+# E2B R3 gateway receiver identifier for each target region offered in the UI
+E2B_RECEIVER_IDS = {
+    "EU (EMA)": "EVHUMAN",
+    "Japan (PMDA)": "PMDA",
+    "Canada (HC)": "HCSC",
+}
+
+# Demo tables, built once at import rather than on every rerun
+MEDDRA_DEMO_RESULTS = pd.DataFrame([
+    {"Term": "severe nausea", "MedDRA PT": "Nausea", "Code": "10017947", "Confidence": "96%"},
+    {"Term": "vomiting", "MedDRA PT": "Vomiting", "Code": "10046743", "Confidence": "94%"}
+])
+
+QUALITY_FACTORS = pd.DataFrame([
+    {"Factor": "Patient Info Completeness", "Score": 85},
+    {"Factor": "Event Description Adequacy", "Score": 92},
+    {"Factor": "Temporal Relationship", "Score": 78}
+])
+
+TEMPLATE_NAMES = (
+    "Standard AE Narrative",
+    "Serious AE Narrative",
+    "Follow-up Request",
+    "Medical Query"
+)
+
+TEMPLATES_TABLE = pd.DataFrame({"Template": [f"📄 {template}" for template in TEMPLATE_NAMES]})
+
+# Static page markup, built once at import and re-sent unchanged on each rerun
+_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -68,76 +105,70 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = "<h1 class='main-header'>🏥 PV Sentinel - AI-Powered Pharmacovigilance Assistant</h1>"
+
+_SAFETY_WARNING_HTML = """
+<div class='safety-warning'>
+    <h3>🚨 Patient Safety First</h3>
+    <p>This system prioritizes patient safety through:</p>
+    <ul>
+        <li><strong>Patient Context Preservation</strong> - Prevents AI paraphrasing of critical patient details</li>
+        <li><strong>Model Version Tracking</strong> - Complete audit trail for regulatory compliance</li>
+        <li><strong>Voice Readback Confirmation</strong> - Prevents transcription errors</li>
+    </ul>
+</div>
+"""
+
+_PHASE4B_FEATURES_HTML = """
+<div class='success-box'>
+    <h3>🚀 Phase 4B Features Available</h3>
+    <p><strong>New in this release:</strong></p>
+    <ul>
+        <li><strong>Regulatory Export</strong> - E2B R3 XML, PSUR narratives, FDA FAERS compatibility</li>
+        <li><strong>MedDRA Integration</strong> - 95%+ accuracy automated term mapping</li>
+        <li><strong>Smart Automation</strong> - AI-powered workflow automation and quality scoring</li>
+    </ul>
+    <p><em>Total Market Opportunity: €650K+ ARR validated through focus group research</em></p>
+</div>
+"""
+
+# Demo-mode PSUR preview, used when the export backend is unavailable
+_PSUR_PLACEHOLDER = "PSUR for {product} during {period}..."
+
+# Custom CSS for better styling
+st.markdown(_CSS, unsafe_allow_html=True)
+
+def render_metric_row(metrics: List[Tuple[str, Any]]):
+    """Render a row of label/value metrics as native st.metric widgets, one column each"""
+    for column, (label, value) in zip(st.columns(len(metrics)), metrics):
+        column.metric(label, value)
 
 def main():
     # Main header
-    st.markdown("<h1 class='main-header'>🏥 PV Sentinel - AI-Powered Pharmacovigilance Assistant</h1>", unsafe_allow_html=True)
-    
-    # Backend status indicator
-    if not backend_available:
-        if import_error_message:
-            st.warning(f"⚠️ {import_error_message}")
-        else:
-            st.error("⚠️ Backend modules not fully loaded. Some features may be limited to demo mode.")
-    else:
-        st.success("✅ All backend modules loaded successfully")
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Safety warning
-    st.markdown("""
-    <div class='safety-warning'>
-        <h3>🚨 Patient Safety First</h3>
-        <p>This system prioritizes patient safety through:</p>
-        <ul>
-            <li><strong>Patient Context Preservation</strong> - Prevents AI paraphrasing of critical patient details</li>
-            <li><strong>Model Version Tracking</strong> - Complete audit trail for regulatory compliance</li>
-            <li><strong>Voice Readback Confirmation</strong> - Prevents transcription errors</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SAFETY_WARNING_HTML, unsafe_allow_html=True)
     
     # Phase 4B Features Available
-    st.markdown("""
-    <div class='success-box'>
-        <h3>🚀 Phase 4B Features Available</h3>
-        <p><strong>New in this release:</strong></p>
-        <ul>
-            <li><strong>Regulatory Export</strong> - E2B R3 XML, PSUR narratives, FDA FAERS compatibility</li>
-            <li><strong>MedDRA Integration</strong> - 95%+ accuracy automated term mapping</li>
-            <li><strong>Smart Automation</strong> - AI-powered workflow automation and quality scoring</li>
-        </ul>
-        <p><em>Total Market Opportunity: €650K+ ARR validated through focus group research</em></p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_PHASE4B_FEATURES_HTML, unsafe_allow_html=True)
+    
+    # Native multipage navigation: only the selected page function runs
+    page = st.navigation([
+        st.Page(show_home_demo, title="Home", icon="🏠", url_path="home", default=True),
+        st.Page(show_regulatory_demo, title="Regulatory Export (E2B/PSUR/FAERS)", icon="📋", url_path="regulatory"),
+        st.Page(show_meddra_demo, title="MedDRA Integration (Term Mapping)", icon="🧠", url_path="meddra"),
+        st.Page(show_automation_demo, title="Smart Automation (AI Workflows)", icon="🤖", url_path="automation"),
+        st.Page(show_analytics_demo, title="Enhanced Analytics", icon="📊", url_path="analytics"),
+        st.Page(show_templates_demo, title="Templates & Bulk Actions", icon="📝", url_path="templates")
+    ])
     
     # Simple demo interface
     st.header("🏥 PV Sentinel Demo Interface")
     
-    # Feature selection
-    feature = st.selectbox(
-        "Select Phase 4B Feature to Demo:",
-        [
-            "Home",
-            "Regulatory Export (E2B/PSUR/FAERS)",
-            "MedDRA Integration (Term Mapping)",
-            "Smart Automation (AI Workflows)",
-            "Enhanced Analytics",
-            "Templates & Bulk Actions"
-        ]
-    )
-    
-    if feature == "Home":
-        show_home_demo()
-    elif feature == "Regulatory Export (E2B/PSUR/FAERS)":
-        show_regulatory_demo()
-    elif feature == "MedDRA Integration (Term Mapping)":
-        show_meddra_demo()
-    elif feature == "Smart Automation (AI Workflows)":
-        show_automation_demo()
-    elif feature == "Enhanced Analytics":
-        show_analytics_demo()
-    elif feature == "Templates & Bulk Actions":
-        show_templates_demo()
+    page.run()
 
 def show_home_demo():
     st.markdown("### Welcome to PV Sentinel Phase 4B")
@@ -171,35 +202,121 @@ def show_home_demo():
         - Quality scoring system
         """)
 
+@st.cache_data
+def load_config() -> Dict:
+    """Parse config/config.yaml once; falls back to backend defaults if unavailable"""
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            return yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        return {}
+
+# Each backend is imported inside its get_* factory, so a page only pays for the
+# modules it uses; the page catches ImportError and falls back to demo mode.
+#
+# Backend managers are stateless with respect to the user, so one instance per
+# server process is shared across reruns and sessions. st.cache_resource hands
+# out that same object rather than a pickled copy. Never cache per-user state
+# (sessions, drafts) this way - that belongs in st.session_state.
+
+@st.cache_resource(show_spinner=False)
+def get_regulatory_export_manager():
+    """Shared RegulatoryExportManager"""
+    from backend.regulatory_export import create_regulatory_export_manager
+    return create_regulatory_export_manager(load_config())
+
+def batch_export_e2b(export_manager, case_ids: Tuple[str, ...], region: str):
+    """Export all selected demo cases in a single E2B message.
+    
+    Never cached: every export needs its own message number and transmission date.
+    """
+    selected_cases = [case for case in DEMO_CASES if case["case_id"] in case_ids]
+    return export_manager.export_to_e2b_r3(selected_cases, {"receiver_id": E2B_RECEIVER_IDS[region]})
+
+def stream_psur_sections(export_manager, product: str, period: str) -> Iterator[str]:
+    """Yield the PSUR narrative section by section, newline-separated as export_to_psur_narrative joins them.
+    
+    Never cached: the report carries its generation time and a data lock point of today.
+    """
+    sections = export_manager.stream_psur_narrative(
+        DEMO_CASES,
+        {"product_name": product, "reporting_period": period}
+    )
+    for index, section in enumerate(sections):
+        if index:
+            yield "\n"
+        yield section
+
 def show_regulatory_demo():
     st.markdown("### 📋 Regulatory Export System")
     
+    # Backend status indicator for the modules this page uses
+    try:
+        export_manager = get_regulatory_export_manager()
+        st.success("✅ Regulatory export backend imported successfully")
+    except ImportError as e:
+        export_manager = None
+        st.warning(f"⚠️ Regulatory export backend not available ({e}). Exports run in demo mode.")
+    
     tab1, tab2, tab3 = st.tabs(["E2B Export", "PSUR Generation", "FAERS Export"])
     
+    # Each tab is its own fragment so a button click reruns only that tab
     with tab1:
-        st.markdown("**E2B R3 XML Generation**")
-        region = st.selectbox("Target Region", ["EU (EMA)", "Japan (PMDA)", "Canada (HC)"])
-        cases = st.multiselect("Select Cases", ["CASE_001", "CASE_002", "CASE_003"])
-        
-        if st.button("Generate E2B XML"):
-            st.success("✅ E2B export generated successfully!")
-            st.info(f"Generated for {region} with {len(cases)} cases")
+        show_e2b_export(export_manager)
     
     with tab2:
-        st.markdown("**PSUR Narrative Automation**")
-        product = st.text_input("Product Name", "Investigational Product X")
-        period = st.text_input("Reporting Period", "01-Jul-2023 to 31-Dec-2023")
-        
-        if st.button("Generate PSUR"):
-            st.success("✅ PSUR narrative generated!")
-            st.text_area("Preview", f"PSUR for {product} during {period}...")
+        show_psur_generation(export_manager)
     
     with tab3:
-        st.markdown("**FDA FAERS Export**")
-        st.info("US market regulatory submission capability")
-        if st.button("Generate FAERS XML"):
-            st.success("✅ FAERS export ready for US submission!")
+        show_faers_export()
+
+@st.fragment
+def show_e2b_export(export_manager):
+    st.markdown("**E2B R3 XML Generation**")
+    region = st.selectbox("Target Region", list(E2B_RECEIVER_IDS))
+    cases = st.multiselect("Select Cases", ["CASE_001", "CASE_002", "CASE_003"])
+    
+    # An E2B message needs at least one safety report
+    if st.button("Generate E2B XML", disabled=not cases, help="Select at least one case to export"):
+        if export_manager is not None:
+            # One export call covers every selected case
+            e2b_message = batch_export_e2b(export_manager, tuple(cases), region)
+            st.success("✅ E2B export generated successfully!")
+            st.info(f"Generated {e2b_message.message_number} for {region} with {len(e2b_message.safety_reports)} cases")
+        else:
+            st.success("✅ E2B export generated successfully!")
+            st.info(f"Generated for {region} with {len(cases)} cases")
 
+@st.fragment
+def show_psur_generation(export_manager):
+    st.markdown("**PSUR Narrative Automation**")
+    product = st.text_input("Product Name", "Investigational Product X")
+    period = st.text_input("Reporting Period", "01-Jul-2023 to 31-Dec-2023")
+    
+    streamed = False
+    if st.button("Generate PSUR"):
+        if export_manager is not None:
+            # Render section by section, keep the full text for reruns
+            st.session_state["psur_narrative"] = st.write_stream(
+                stream_psur_sections(export_manager, product, period)
+            )
+            streamed = True
+        else:
+            st.session_state["psur_narrative"] = _PSUR_PLACEHOLDER.format(product=product, period=period)
+        st.success("✅ PSUR narrative generated!")
+    
+    # Show the stored narrative once: skip the preview on the run that just streamed it
+    if "psur_narrative" in st.session_state and not streamed:
+        st.text_area("Preview", st.session_state["psur_narrative"], height=300)
+
+@st.fragment
+def show_faers_export():
+    st.markdown("**FDA FAERS Export**")
+    st.info("US market regulatory submission capability")
+    if st.button("Generate FAERS XML"):
+        st.success("✅ FAERS export ready for US submission!")
+
+@st.fragment
 def show_meddra_demo():
     st.markdown("### 🧠 MedDRA Integration & Term Mapping")
     
@@ -209,22 +326,21 @@ def show_meddra_demo():
     )
     
     if st.button("Auto-Map Terms"):
+        st.session_state["meddra_result"] = {"text": text_input, "results": MEDDRA_DEMO_RESULTS}
+    
+    # Reuse the last mapping on unrelated reruns; drop it once the input text changes
+    meddra_result = st.session_state.get("meddra_result")
+    if meddra_result and meddra_result["text"] == text_input:
         st.success("✅ Terms mapped successfully!")
         
-        results = [
-            {"Term": "severe nausea", "MedDRA PT": "Nausea", "Code": "10017947", "Confidence": "96%"},
-            {"Term": "vomiting", "MedDRA PT": "Vomiting", "Code": "10046743", "Confidence": "94%"}
-        ]
-        
-        st.dataframe(results)
+        results = meddra_result["results"]
+        st.dataframe(results, hide_index=True)
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Terms Found", len(results))
-        with col2:
-            st.metric("Avg Confidence", "95%")
-        with col3:
-            st.metric("Processing Time", "0.34s")
+        render_metric_row([
+            ("Terms Found", len(results)),
+            ("Avg Confidence", "95%"),
+            ("Processing Time", "0.34s")
+        ])
 
 def show_automation_demo():
     st.markdown("### 🤖 Smart Automation & AI Workflows")
@@ -232,68 +348,95 @@ def show_automation_demo():
     tab1, tab2 = st.tabs(["Case Classification", "Quality Scoring"])
     
     with tab1:
-        st.markdown("**AI Case Classification**")
-        case_desc = st.text_area("Case Description", "65-year-old patient hospitalized after severe reaction")
-        
-        if st.button("Classify Case"):
-            st.success("✅ Classification complete!")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Severity", "Serious")
-            with col2:
-                st.metric("Confidence", "87%")
-            with col3:
-                st.metric("Processing", "1.2s")
+        show_case_classification()
     
     with tab2:
-        st.markdown("**Quality Scoring System**")
-        if st.button("Calculate Quality Score"):
-            st.success("✅ Quality assessment complete!")
-            
-            factors = [
-                {"Factor": "Patient Info Completeness", "Score": 85},
-                {"Factor": "Event Description Adequacy", "Score": 92},
-                {"Factor": "Temporal Relationship", "Score": 78}
-            ]
-            
-            st.dataframe(factors)
-            st.metric("Overall Quality Score", "87.3/100")
+        show_quality_scoring()
+
+@st.fragment
+def show_case_classification():
+    st.markdown("**AI Case Classification**")
+    case_desc = st.text_area("Case Description", "65-year-old patient hospitalized after severe reaction")
+    
+    if st.button("Classify Case"):
+        st.session_state["classification_case"] = case_desc
+    
+    if st.session_state.get("classification_case") == case_desc:
+        st.success("✅ Classification complete!")
+        
+        render_metric_row([
+            ("Severity", "Serious"),
+            ("Confidence", "87%"),
+            ("Processing", "1.2s")
+        ])
+
+@st.fragment
+def show_quality_scoring():
+    st.markdown("**Quality Scoring System**")
+    if st.button("Calculate Quality Score"):
+        st.session_state["quality_scored"] = True
+    
+    if st.session_state.get("quality_scored"):
+        st.success("✅ Quality assessment complete!")
+        
+        st.dataframe(QUALITY_FACTORS, hide_index=True)
+        st.metric("Overall Quality Score", "87.3/100")
+
+def get_analytics_snapshot() -> Dict[str, Dict[str, str]]:
+    """Gather all dashboard metrics in one call"""
+    return {
+        "Processing Metrics": {
+            "Cases Processed": "1,247",
+            "Avg Processing Time": "1.8s",
+            "Success Rate": "99.1%"
+        },
+        "Quality Metrics": {
+            "E2B Compliance": "98.5%",
+            "MedDRA Accuracy": "95.7%",
+            "User Satisfaction": "90%+"
+        }
+    }
 
 def show_analytics_demo():
     st.markdown("### 📊 Enhanced Analytics Dashboard")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Processing Metrics**")
-        st.metric("Cases Processed", "1,247")
-        st.metric("Avg Processing Time", "1.8s")
-        st.metric("Success Rate", "99.1%")
+    snapshot = get_analytics_snapshot()
     
-    with col2:
-        st.markdown("**Quality Metrics**")
-        st.metric("E2B Compliance", "98.5%")
-        st.metric("MedDRA Accuracy", "95.7%")
-        st.metric("User Satisfaction", "90%+")
+    # One table element for the whole snapshot rather than a metric widget per value
+    st.table(pd.DataFrame(
+        [
+            {"Category": group, "Metric": label, "Value": value}
+            for group, metrics in snapshot.items()
+            for label, value in metrics.items()
+        ]
+    ).set_index(["Category", "Metric"]))
 
+@st.fragment
 def show_templates_demo():
     st.markdown("### 📝 Templates & Bulk Actions")
     
     st.markdown("**Available Templates:**")
-    templates = [
-        "Standard AE Narrative",
-        "Serious AE Narrative", 
-        "Follow-up Request",
-        "Medical Query"
-    ]
-    
-    for template in templates:
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.write(f"📄 {template}")
-        with col2:
-            st.button("Use", key=f"template_{template}")
+    
+    # Render the whole list once; row selection drives the detail view
+    selection = st.dataframe(
+        TEMPLATES_TABLE,
+        hide_index=True,
+        width="stretch",
+        on_select="rerun",
+        selection_mode="single-row",
+        key="template_table"
+    )
+    
+    selected_rows = selection.selection.rows
+    if selected_rows:
+        st.session_state["selected_template"] = TEMPLATE_NAMES[selected_rows[0]]
+    else:
+        st.session_state.pop("selected_template", None)
+    
+    selected_template = st.session_state.get("selected_template")
+    if selected_template:
+        if st.button(f"Use {selected_template}", key="template_use"):
+            st.success(f"✅ {selected_template} template loaded!")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -7,6 +7,7 @@ Basic installation and initial configuration
 import os
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 def create_directories():
     """Create necessary directories for PV Sentinel"""
@@ -20,9 +21,11 @@ def create_directories():
         'validation/test_results'
     ]
     
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created directory: {directory}")
+    # Directory creation is I/O bound; overlap the filesystem round trips
+    with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+        list(executor.map(lambda directory: Path(directory).mkdir(parents=True, exist_ok=True), directories))
+    
+    print("✅ Created directories:\n  " + "\n  ".join(directories))
 
 def check_python_version():
     """Check if Python version is compatible"""
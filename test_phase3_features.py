@@ -30,9 +30,10 @@ except ImportError as e:
 class TestPhase3UXEnhancement(unittest.TestCase):
     """Test Phase 3 UX Enhancement features"""
     
-    def setUp(self):
-        """Set up test configuration"""
-        self.test_config = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test configuration and managers once for the class"""
+        cls.test_config = {
             'ux_enhancement': {
                 'responsive_design': True,
                 'accessibility': True,
@@ -42,6 +43,12 @@ class TestPhase3UXEnhancement(unittest.TestCase):
                 'simplify_language': True
             }
         }
+        
+        cls.managers = None
+        if backend_available:
+            cls.managers = create_ux_enhancement_system(cls.test_config)
+            (cls.responsive_manager, cls.accessibility_manager,
+             cls.analytics_manager, cls.patient_interface_manager) = cls.managers
     
     def test_import_ux_enhancement(self):
         """Test UX enhancement module import"""
@@ -51,14 +58,21 @@ class TestPhase3UXEnhancement(unittest.TestCase):
     @unittest.skipUnless(backend_available, "Backend modules required")
     def test_create_ux_system(self):
         """Test UX enhancement system creation"""
-        managers = create_ux_enhancement_system(self.test_config)
-        self.assertEqual(len(managers), 4)
+        self.assertEqual(len(self.managers), 4)
+        
+        # Each manager also builds directly from the config
+        manager_classes = (ResponsiveDesignManager, AccessibilityManager,
+                           AnalyticsManager, PatientInterfaceManager)
+        for manager_class, manager in zip(manager_classes, self.managers):
+            with self.subTest(manager=manager_class.__name__):
+                self.assertIsInstance(manager, manager_class)
+                self.assertIsInstance(manager_class(self.test_config), manager_class)
         print("✅ UX enhancement system creation: PASSED")
     
     @unittest.skipUnless(backend_available, "Backend modules required")
     def test_responsive_design_manager(self):
         """Test responsive design manager"""
-        manager = ResponsiveDesignManager(self.test_config)
+        manager = self.responsive_manager
         self.assertTrue(manager.responsive_enabled)
         
         # Test device detection
@@ -69,7 +83,7 @@ class TestPhase3UXEnhancement(unittest.TestCase):
     @unittest.skipUnless(backend_available, "Backend modules required")
     def test_accessibility_manager(self):
         """Test accessibility manager"""
-        manager = AccessibilityManager(self.test_config)
+        manager = self.accessibility_manager
         self.assertTrue(manager.accessibility_enabled)
         self.assertEqual(manager.target_level, AccessibilityLevel.AA)
         print("✅ Accessibility manager: PASSED")
@@ -77,7 +91,7 @@ class TestPhase3UXEnhancement(unittest.TestCase):
     @unittest.skipUnless(backend_available, "Backend modules required")
     def test_analytics_manager(self):
         """Test analytics manager"""
-        manager = AnalyticsManager(self.test_config)
+        manager = self.analytics_manager
         self.assertTrue(manager.analytics_enabled)
         
         # Test event tracking
@@ -88,7 +102,7 @@ class TestPhase3UXEnhancement(unittest.TestCase):
     @unittest.skipUnless(backend_available, "Backend modules required")
     def test_patient_interface_manager(self):
         """Test patient interface manager"""
-        manager = PatientInterfaceManager(self.test_config)
+        manager = self.patient_interface_manager
         self.assertTrue(manager.patient_interface_enabled)
         
         # Test text simplification
@@ -5,446 +5,450 @@ Comprehensive testing for enhanced analytics, operational improvements, and smar
 Test Coverage:
 - Phase 4A: Enhanced Analytics, Templates, Bulk Processing, Quick Actions, Enhanced Search
 - Phase 4B: Intelligent Case Processing, Advanced NLP, Workflow Automation
+
+Run in parallel with pytest-xdist:
+    python -m pytest test_phase4_features.py -n auto --dist=loadfile
 """
 
 import unittest
+import importlib
+import importlib.util
 import sys
 import os
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import MappingProxyType
 
 # Add the parent directory to the path so we can import backend modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Import each backend once; tests skip when a module is not available (development mode)
+try:
+    from backend.enhanced_analytics import create_enhanced_analytics_manager, MetricType, ReportFormat
+    HAS_ANALYTICS = True
+except ImportError:
+    HAS_ANALYTICS = False
+
+try:
+    from backend.operational_improvements import create_operational_improvements_system
+    HAS_OPERATIONAL = True
+except ImportError:
+    HAS_OPERATIONAL = False
+
+try:
+    from backend.operational_improvements import TemplateType
+    HAS_TEMPLATES = HAS_OPERATIONAL
+except ImportError:
+    HAS_TEMPLATES = False
+
+try:
+    from backend.smart_automation import create_smart_automation_system
+    HAS_SMART_AUTOMATION = True
+except ImportError:
+    HAS_SMART_AUTOMATION = False
+
+try:
+    from backend.smart_automation import AutoClassificationResult, SeverityLevel
+    HAS_CLASSIFICATION_TYPES = HAS_SMART_AUTOMATION
+except ImportError:
+    HAS_CLASSIFICATION_TYPES = False
+
+# Fixed instant for test data so classification results are reproducible
+FIXED_TIMESTAMP = "2025-01-01T00:00:00"
+
+# Static test data, built once and shared read-only across tests
+ANALYTICS_CONFIG = MappingProxyType({
+    'phase_4a': {
+        'enhanced_analytics': {
+            'enabled': True,
+            'export_enabled': True,
+            'export_formats': ['pdf', 'excel', 'csv', 'json'],
+            'mvp_validation_tracking': True
+        }
+    }
+})
+
+OPERATIONAL_CONFIG = MappingProxyType({
+    'phase_4a': {
+        'operational_improvements': {
+            'templates': {'enabled': True, 'max_templates': 100},
+            'bulk_processing': {'enabled': True, 'max_batch_size': 50},
+            'quick_actions': {'enabled': True},
+            'enhanced_search': {'enabled': True}
+        }
+    }
+})
+
+SMART_AUTOMATION_CONFIG = MappingProxyType({
+    'phase_4b': {
+        'intelligent_processing': {
+            'enabled': True,
+            'auto_classification': True,
+            'confidence_threshold': 0.8
+        },
+        'advanced_nlp': {
+            'enabled': True,
+            'medical_dictionary': True
+        },
+        'workflow_automation': {
+            'enabled': True,
+            'auto_routing': True,
+            'compliance_checks': True
+        }
+    }
+})
+
+SAMPLE_CASE = MappingProxyType({
+    'case_id': 'TEST_001',
+    'description': 'Patient experienced severe headache and nausea after taking medication',
+    'patient_age': 45,
+    'patient_gender': 'female',
+    'product_name': 'TestDrug',
+    'time_to_onset_hours': 24,
+    'reporter_type': 'physician'
+})
+
+# Import paths the frontend relies on: (feature, module, factory)
+FRONTEND_INTEGRATION_POINTS = (
+    ("Enhanced Analytics", "backend.enhanced_analytics", "create_enhanced_analytics_manager"),
+    ("Operational Improvements", "backend.operational_improvements", "create_operational_improvements_system"),
+    ("Smart Automation", "backend.smart_automation", "create_smart_automation_system")
+)
+
+@unittest.skipUnless(HAS_ANALYTICS, "Enhanced Analytics module not available")
 class TestPhase4AEnhancedAnalytics(unittest.TestCase):
     """Test Phase 4A Enhanced Analytics functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the manager once for the class"""
+        cls.manager = create_enhanced_analytics_manager(ANALYTICS_CONFIG)
+    
     def setUp(self):
-        """Set up test configuration"""
-        self.config = {
-            'phase_4a': {
-                'enhanced_analytics': {
-                    'enabled': True,
-                    'export_enabled': True,
-                    'export_formats': ['pdf', 'excel', 'csv', 'json'],
-                    'mvp_validation_tracking': True
-                }
-            }
-        }
+        """Start each test with no tracked metrics"""
+        self.manager.metrics_data.clear()
     
     def test_enhanced_analytics_manager_initialization(self):
         """Test Enhanced Analytics Manager initialization"""
-        try:
-            from backend.enhanced_analytics import create_enhanced_analytics_manager
-            manager = create_enhanced_analytics_manager(self.config)
-            
-            self.assertIsNotNone(manager)
-            self.assertTrue(manager.enabled)
-            self.assertTrue(manager.export_enabled)
-            print("✅ Enhanced Analytics Manager initialization: PASSED")
-            
-        except ImportError:
-            print("⚠️ Enhanced Analytics Manager: Module not available (development mode)")
-            self.skipTest("Enhanced Analytics module not available")
+        self.assertIsNotNone(self.manager)
+        self.assertTrue(self.manager.enabled)
+        self.assertTrue(self.manager.export_enabled)
     
     def test_mvp_metrics_tracking(self):
         """Test MVP validation metrics tracking"""
-        try:
-            from backend.enhanced_analytics import create_enhanced_analytics_manager, MetricType
-            manager = create_enhanced_analytics_manager(self.config)
-            
-            # Test metric tracking
-            success = manager.track_metric(
-                metric_type=MetricType.USER_ADOPTION,
-                metric_name="daily_active_users",
-                value=87.5,
-                unit="percentage",
-                user_role="operations_manager"
-            )
-            
-            self.assertTrue(success)
-            self.assertEqual(len(manager.metrics_data), 1)
-            
-            # Test MVP validation metrics
-            mvp_metrics = manager.get_mvp_validation_metrics()
-            self.assertIn("user_adoption_rate", mvp_metrics)
-            self.assertIn("productivity_improvements", mvp_metrics)
-            
-            print("✅ MVP Metrics Tracking: PASSED")
-            
-        except ImportError:
-            print("⚠️ MVP Metrics Tracking: Module not available (development mode)")
-            self.skipTest("Enhanced Analytics module not available")
+        # Test metric tracking
+        success = self.manager.track_metric(
+            metric_type=MetricType.USER_ADOPTION,
+            metric_name="daily_active_users",
+            value=87.5,
+            unit="percentage",
+            user_role="operations_manager"
+        )
+        
+        self.assertTrue(success)
+        self.assertEqual(len(self.manager.metrics_data), 1)
+        
+        # Test MVP validation metrics
+        mvp_metrics = self.manager.get_mvp_validation_metrics()
+        self.assertIn("user_adoption_rate", mvp_metrics)
+        self.assertIn("productivity_improvements", mvp_metrics)
+    
+    def test_bulk_metrics_tracking(self):
+        """Test batch metric tracking"""
+        success = self.manager.track_metrics([
+            {
+                "metric_type": MetricType.USER_ADOPTION,
+                "metric_name": "daily_active_users",
+                "value": 87.5,
+                "unit": "percentage",
+                "user_role": "operations_manager"
+            },
+            {
+                "metric_type": MetricType.PROCESSING_TIME,
+                "metric_name": "avg_case_processing",
+                "value": 12.4,
+                "unit": "minutes"
+            }
+        ])
+        
+        self.assertTrue(success)
+        self.assertEqual(len(self.manager.metrics_data), 2)
+        self.assertEqual(self.manager.metrics_data[1].metric_name, "avg_case_processing")
+        
+        # An invalid entry rejects the whole batch
+        self.assertFalse(self.manager.track_metrics([{"metric_name": "missing_fields"}]))
+        self.assertEqual(len(self.manager.metrics_data), 2)
     
     def test_analytics_export_functionality(self):
         """Test analytics export in different formats"""
-        try:
-            from backend.enhanced_analytics import create_enhanced_analytics_manager, ReportFormat
-            manager = create_enhanced_analytics_manager(self.config)
-            
-            # Test JSON export
-            json_report = manager.export_analytics_report(
-                report_format=ReportFormat.JSON,
-                user_role="medical_director",
-                time_period=30
-            )
-            
-            self.assertIsNotNone(json_report)
-            self.assertIn("PV Sentinel Analytics Report", json_report)
-            
-            # Test CSV export
-            csv_report = manager.export_analytics_report(
-                report_format=ReportFormat.CSV,
-                user_role="operations_manager",
-                time_period=7
-            )
-            
-            self.assertIsNotNone(csv_report)
-            self.assertIn("Generated Date", csv_report)
-            
-            print("✅ Analytics Export Functionality: PASSED")
-            
-        except ImportError:
-            print("⚠️ Analytics Export: Module not available (development mode)")
-            self.skipTest("Enhanced Analytics module not available")
+        # Test JSON export
+        json_report = self.manager.export_analytics_report(
+            report_format=ReportFormat.JSON,
+            user_role="medical_director",
+            time_period=30
+        )
+        
+        self.assertIsNotNone(json_report)
+        # The report title is always the first key, so a bounded prefix check suffices
+        self.assertTrue(json_report.startswith('{\n  "report_title": "PV Sentinel Analytics Report'))
+        
+        # Test CSV export
+        csv_report = self.manager.export_analytics_report(
+            report_format=ReportFormat.CSV,
+            user_role="operations_manager",
+            time_period=7
+        )
+        
+        self.assertIsNotNone(csv_report)
+        title_line, date_line, _ = csv_report.split("\n", 2)
+        self.assertTrue(title_line.startswith("PV Sentinel Analytics Report,"))
+        self.assertTrue(date_line.startswith("Generated Date,"))
+        
+        # Test streamed export yields the same CSV layout chunk by chunk
+        csv_chunks = list(self.manager.stream_analytics_report(
+            report_format=ReportFormat.CSV,
+            user_role="operations_manager",
+            time_period=7
+        ))
+        self.assertGreater(len(csv_chunks), 1)
+        self.assertEqual("".join(csv_chunks).count("\n"), csv_report.count("\n"))
 
+@unittest.skipUnless(HAS_OPERATIONAL, "Operational Improvements module not available")
 class TestPhase4AOperationalImprovements(unittest.TestCase):
     """Test Phase 4A Operational Improvements functionality"""
     
-    def setUp(self):
-        """Set up test configuration"""
-        self.config = {
-            'phase_4a': {
-                'operational_improvements': {
-                    'templates': {'enabled': True, 'max_templates': 100},
-                    'bulk_processing': {'enabled': True, 'max_batch_size': 50},
-                    'quick_actions': {'enabled': True},
-                    'enhanced_search': {'enabled': True}
-                }
-            }
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Build the managers once for the class"""
+        (cls.template_manager, cls.bulk_manager,
+         cls.quick_actions_manager, cls.search_manager) = create_operational_improvements_system(OPERATIONAL_CONFIG)
     
+    @unittest.skipUnless(HAS_TEMPLATES, "Operational Improvements module not available")
     def test_template_management(self):
         """Test template creation and management"""
-        try:
-            from backend.operational_improvements import create_operational_improvements_system, TemplateType
-            
-            template_manager, _, _, _ = create_operational_improvements_system(self.config)
-            
-            # Test template creation
-            template_id = template_manager.create_template(
-                template_type=TemplateType.CASE_NARRATIVE,
-                name="Test Template",
-                description="Test description",
-                content="Patient {age} experienced {event}",
-                created_by="test_user"
-            )
-            
-            self.assertIsNotNone(template_id)
-            
-            # Test template retrieval
-            template = template_manager.get_template(template_id)
-            self.assertIsNotNone(template)
-            self.assertEqual(template.name, "Test Template")
-            
-            # Test template application
-            rendered = template_manager.apply_template(template_id, {"age": "65", "event": "headache"})
-            self.assertIn("Patient 65 experienced headache", rendered)
-            
-            print("✅ Template Management: PASSED")
-            
-        except ImportError:
-            print("⚠️ Template Management: Module not available (development mode)")
-            self.skipTest("Operational Improvements module not available")
+        # Test template creation
+        template_id = self.template_manager.create_template(
+            template_type=TemplateType.CASE_NARRATIVE,
+            name="Test Template",
+            description="Test description",
+            content="Patient {age} experienced {event}",
+            created_by="test_user"
+        )
+        
+        self.assertIsNotNone(template_id)
+        
+        # Test template retrieval
+        template = self.template_manager.get_template(template_id)
+        self.assertIsNotNone(template)
+        self.assertEqual(template.name, "Test Template")
+        
+        # Test template application
+        rendered = self.template_manager.apply_template(template_id, {"age": "65", "event": "headache"})
+        self.assertIn("Patient 65 experienced headache", rendered)
     
     def test_bulk_processing(self):
         """Test bulk processing functionality"""
-        try:
-            from backend.operational_improvements import create_operational_improvements_system
-            
-            _, bulk_manager, _, _ = create_operational_improvements_system(self.config)
-            
-            # Test bulk operation
-            result = bulk_manager.process_batch(
-                operation_type="assign_reviewer",
-                target_items=["CASE_001", "CASE_002", "CASE_003"],
-                parameters={"reviewer": "Dr. Smith"},
-                created_by="test_user"
-            )
-            
-            self.assertTrue(result["success"])
-            self.assertEqual(result["total_items"], 3)
-            self.assertIn("processing_time", result)
-            
-            print("✅ Bulk Processing: PASSED")
-            
-        except ImportError:
-            print("⚠️ Bulk Processing: Module not available (development mode)")
-            self.skipTest("Operational Improvements module not available")
+        # Test bulk operation
+        result = self.bulk_manager.process_batch(
+            operation_type="assign_reviewer",
+            target_items=["CASE_001", "CASE_002", "CASE_003"],
+            parameters={"reviewer": "Dr. Smith"},
+            created_by="test_user"
+        )
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(result["total_items"], 3)
+        self.assertIn("processing_time", result)
     
     def test_quick_actions(self):
         """Test quick actions functionality"""
-        try:
-            from backend.operational_improvements import create_operational_improvements_system
-            
-            _, _, quick_actions_manager, _ = create_operational_improvements_system(self.config)
-            
-            # Test getting available actions
-            user_permissions = ["assign_reviewer", "modify_priority"]
-            actions = quick_actions_manager.get_available_actions(user_permissions)
-            
-            self.assertGreater(len(actions), 0)
-            
-            # Test executing quick action
-            if actions:
-                action_id = actions[0].action_id
-                result = quick_actions_manager.execute_quick_action(
-                    action_id=action_id,
-                    target_items=["CASE_001"],
-                    action_parameters={"priority": "high"},
-                    executed_by="test_user"
-                )
-                
-                self.assertTrue(result["success"])
-                self.assertEqual(result["affected_items"], 1)
-            
-            print("✅ Quick Actions: PASSED")
+        # Test getting available actions
+        user_permissions = ["assign_reviewer", "modify_priority"]
+        actions = self.quick_actions_manager.get_available_actions(user_permissions)
+        
+        self.assertGreater(len(actions), 0)
+        
+        # Test executing quick action
+        if actions:
+            action_id = actions[0].action_id
+            result = self.quick_actions_manager.execute_quick_action(
+                action_id=action_id,
+                target_items=["CASE_001"],
+                action_parameters={"priority": "high"},
+                executed_by="test_user"
+            )
             
-        except ImportError:
-            print("⚠️ Quick Actions: Module not available (development mode)")
-            self.skipTest("Operational Improvements module not available")
+            self.assertTrue(result["success"])
+            self.assertEqual(result["affected_items"], 1)
     
     def test_enhanced_search(self):
         """Test enhanced search functionality"""
-        try:
-            from backend.operational_improvements import create_operational_improvements_system
-            
-            _, _, _, search_manager = create_operational_improvements_system(self.config)
-            
-            # Test search functionality
-            results = search_manager.search_cases(
-                query="high priority cases",
-                filters={"priority": "high", "status": "pending_review"}
-            )
-            
-            self.assertTrue(results["success"])
-            self.assertIn("total_results", results)
-            self.assertIn("results", results)
-            self.assertIn("search_time", results)
-            
-            print("✅ Enhanced Search: PASSED")
-            
-        except ImportError:
-            print("⚠️ Enhanced Search: Module not available (development mode)")
-            self.skipTest("Operational Improvements module not available")
+        # Test search functionality
+        results = self.search_manager.search_cases(
+            query="high priority cases",
+            filters={"priority": "high", "status": "pending_review"}
+        )
+        
+        self.assertTrue(results["success"])
+        self.assertIn("total_results", results)
+        self.assertIn("results", results)
+        self.assertIn("search_time", results)
 
+@unittest.skipUnless(HAS_SMART_AUTOMATION, "Smart Automation module not available")
 class TestPhase4BSmartAutomation(unittest.TestCase):
     """Test Phase 4B Smart Automation functionality"""
     
-    def setUp(self):
-        """Set up test configuration"""
-        self.config = {
-            'phase_4b': {
-                'intelligent_processing': {
-                    'enabled': True,
-                    'auto_classification': True,
-                    'confidence_threshold': 0.8
-                },
-                'advanced_nlp': {
-                    'enabled': True,
-                    'medical_dictionary': True
-                },
-                'workflow_automation': {
-                    'enabled': True,
-                    'auto_routing': True,
-                    'compliance_checks': True
-                }
-            }
-        }
-        
-        self.sample_case = {
-            'case_id': 'TEST_001',
-            'description': 'Patient experienced severe headache and nausea after taking medication',
-            'patient_age': 45,
-            'patient_gender': 'female',
-            'product_name': 'TestDrug',
-            'time_to_onset_hours': 24,
-            'reporter_type': 'physician'
-        }
-    
     def test_intelligent_case_processing(self):
         """Test intelligent case processing and auto-classification"""
-        try:
-            from backend.smart_automation import create_smart_automation_system
-            
-            intelligent_processor, _, _ = create_smart_automation_system(self.config)
-            
-            # Test auto-classification
-            classification = intelligent_processor.auto_classify_severity(self.sample_case)
-            
-            self.assertIsNotNone(classification)
-            self.assertIn(classification.severity_level.value, ['non_serious', 'serious', 'death', 'life_threatening', 'hospitalization'])
-            self.assertGreaterEqual(classification.confidence_score, 0.0)
-            self.assertLessEqual(classification.confidence_score, 1.0)
-            
-            # Test causality assessment
-            causality = intelligent_processor.assess_causality(self.sample_case)
-            
-            self.assertIn("causality_assessment", causality)
-            self.assertIn("confidence_score", causality)
-            
-            # Test quality scoring
-            quality = intelligent_processor.calculate_quality_score(self.sample_case)
-            
-            self.assertIn("overall_score", quality)
-            self.assertIn("quality_grade", quality)
-            
-            print("✅ Intelligent Case Processing: PASSED")
-            
-        except ImportError:
-            print("⚠️ Intelligent Case Processing: Module not available (development mode)")
-            self.skipTest("Smart Automation module not available")
+        intelligent_processor, _, _ = create_smart_automation_system(SMART_AUTOMATION_CONFIG)
+        
+        # Test auto-classification
+        classification = intelligent_processor.auto_classify_severity(SAMPLE_CASE)
+        
+        self.assertIsNotNone(classification)
+        self.assertIn(classification.severity_level.value, ['non_serious', 'serious', 'death', 'life_threatening', 'hospitalization'])
+        self.assertGreaterEqual(classification.confidence_score, 0.0)
+        self.assertLessEqual(classification.confidence_score, 1.0)
+        
+        # Test causality assessment
+        causality = intelligent_processor.assess_causality(SAMPLE_CASE)
+        
+        self.assertIn("causality_assessment", causality)
+        self.assertIn("confidence_score", causality)
+        
+        # Test quality scoring
+        quality = intelligent_processor.calculate_quality_score(SAMPLE_CASE)
+        
+        self.assertIn("overall_score", quality)
+        self.assertIn("quality_grade", quality)
     
     def test_advanced_nlp_processing(self):
         """Test advanced NLP processing functionality"""
-        try:
-            from backend.smart_automation import create_smart_automation_system
-            
-            _, nlp_processor, _ = create_smart_automation_system(self.config)
-            
-            # Test medical term extraction
-            text = "Patient experienced severe headache, nausea, and dizziness after taking aspirin"
-            medical_terms = nlp_processor.extract_medical_terms(text)
-            
-            self.assertIsInstance(medical_terms, list)
-            if medical_terms:
-                self.assertIn("term", [term.term for term in medical_terms])
-                self.assertIn("category", [term.category for term in medical_terms])
-            
-            # Test case summary generation
-            summary = nlp_processor.generate_case_summary(self.sample_case)
-            
-            self.assertIsNotNone(summary)
-            self.assertIsNotNone(summary.executive_summary)
-            self.assertIsInstance(summary.key_facts, list)
-            self.assertIsInstance(summary.timeline, list)
-            
-            print("✅ Advanced NLP Processing: PASSED")
-            
-        except ImportError:
-            print("⚠️ Advanced NLP Processing: Module not available (development mode)")
-            self.skipTest("Smart Automation module not available")
+        _, nlp_processor, _ = create_smart_automation_system(SMART_AUTOMATION_CONFIG)
+        
+        # Test medical term extraction
+        text = "Patient experienced severe headache, nausea, and dizziness after taking aspirin"
+        medical_terms = nlp_processor.extract_medical_terms(text)
+        
+        self.assertIsInstance(medical_terms, list)
+        if medical_terms:
+            self.assertIn("term", [term.term for term in medical_terms])
+            self.assertIn("category", [term.category for term in medical_terms])
+        
+        # Test case summary generation
+        summary = nlp_processor.generate_case_summary(SAMPLE_CASE)
+        
+        self.assertIsNotNone(summary)
+        self.assertIsNotNone(summary.executive_summary)
+        self.assertIsInstance(summary.key_facts, list)
+        self.assertIsInstance(summary.timeline, list)
     
+    @unittest.skipUnless(HAS_CLASSIFICATION_TYPES, "Smart Automation classification types not available")
     def test_workflow_automation(self):
         """Test workflow automation functionality"""
-        try:
-            from backend.smart_automation import create_smart_automation_system, AutoClassificationResult, SeverityLevel
-            
-            intelligent_processor, _, workflow_manager = create_smart_automation_system(self.config)
-            
-            # Create mock classification result
-            classification = AutoClassificationResult(
-                case_id="TEST_001",
-                severity_level=SeverityLevel.SERIOUS,
-                confidence_score=0.85,
-                contributing_factors=["severe symptoms"],
-                recommended_actions=["medical review"],
-                classification_timestamp=datetime.now().isoformat()
-            )
-            
-            # Test case routing
-            routing = workflow_manager.route_case(self.sample_case, classification)
-            
-            self.assertIn("recommended_assignee", routing)
-            self.assertIn("priority_level", routing)
-            self.assertIn("review_timeline", routing)
-            
-            # Test compliance checks
-            compliance = workflow_manager.check_compliance(self.sample_case)
-            
-            self.assertIn("compliance_score", compliance)
-            self.assertIn("compliance_status", compliance)
-            
-            print("✅ Workflow Automation: PASSED")
-            
-        except ImportError:
-            print("⚠️ Workflow Automation: Module not available (development mode)")
-            self.skipTest("Smart Automation module not available")
+        intelligent_processor, _, workflow_manager = create_smart_automation_system(SMART_AUTOMATION_CONFIG)
+        
+        # Create mock classification result
+        classification = AutoClassificationResult(
+            case_id="TEST_001",
+            severity_level=SeverityLevel.SERIOUS,
+            confidence_score=0.85,
+            contributing_factors=["severe symptoms"],
+            recommended_actions=["medical review"],
+            classification_timestamp=FIXED_TIMESTAMP
+        )
+        
+        # Test case routing
+        routing = workflow_manager.route_case(SAMPLE_CASE, classification)
+        
+        self.assertIn("recommended_assignee", routing)
+        self.assertIn("priority_level", routing)
+        self.assertIn("review_timeline", routing)
+        
+        # Test compliance checks
+        compliance = workflow_manager.check_compliance(SAMPLE_CASE)
+        
+        self.assertIn("compliance_score", compliance)
+        self.assertIn("compliance_status", compliance)
 
 class TestPhase4Integration(unittest.TestCase):
     """Test integration between Phase 4A and 4B features"""
     
+    @unittest.skipUnless(HAS_ANALYTICS and HAS_OPERATIONAL, "Phase 4 modules not available")
     def test_phase4_feature_integration(self):
         """Test that Phase 4A and 4B features work together"""
-        print("🔗 Testing Phase 4A & 4B Integration...")
-        
         # Test that enhanced analytics can track smart automation metrics
-        try:
-            from backend.enhanced_analytics import create_enhanced_analytics_manager, MetricType
-            from backend.operational_improvements import create_operational_improvements_system
-            
-            analytics_config = {
-                'phase_4a': {
-                    'enhanced_analytics': {'enabled': True, 'mvp_validation_tracking': True}
-                }
+        analytics_config = {
+            'phase_4a': {
+                'enhanced_analytics': {'enabled': True, 'mvp_validation_tracking': True}
             }
-            
-            ops_config = {
-                'phase_4a': {
-                    'operational_improvements': {
-                        'templates': {'enabled': True},
-                        'bulk_processing': {'enabled': True}
-                    }
+        }
+        
+        ops_config = {
+            'phase_4a': {
+                'operational_improvements': {
+                    'templates': {'enabled': True},
+                    'bulk_processing': {'enabled': True}
                 }
             }
-            
-            analytics_manager = create_enhanced_analytics_manager(analytics_config)
-            template_manager, bulk_manager, _, _ = create_operational_improvements_system(ops_config)
-            
-            # Simulate using operational improvements and tracking with analytics
-            analytics_manager.track_metric(
-                metric_type=MetricType.FEATURE_USAGE,
-                metric_name="template_usage",
-                value=15.0,
-                unit="uses_per_day"
-            )
-            
-            # Test that both systems are working
-            self.assertTrue(analytics_manager.enabled)
-            self.assertTrue(template_manager.enabled)
-            
-            print("✅ Phase 4A & 4B Integration: PASSED")
-            
-        except ImportError:
-            print("⚠️ Phase 4 Integration: Modules not available (development mode)")
-            self.skipTest("Phase 4 modules not available")
+        }
+        
+        analytics_manager = create_enhanced_analytics_manager(analytics_config)
+        template_manager, bulk_manager, _, _ = create_operational_improvements_system(ops_config)
+        
+        # Simulate using operational improvements and tracking with analytics
+        analytics_manager.track_metric(
+            metric_type=MetricType.FEATURE_USAGE,
+            metric_name="template_usage",
+            value=15.0,
+            unit="uses_per_day"
+        )
+        
+        # Test that both systems are working
+        self.assertTrue(analytics_manager.enabled)
+        self.assertTrue(template_manager.enabled)
     
     def test_frontend_integration_readiness(self):
         """Test that frontend integration points are ready"""
-        print("🖥️ Testing Frontend Integration Readiness...")
-        
-        # Test import paths that frontend will use
-        integration_tests = [
-            ("Enhanced Analytics", "backend.enhanced_analytics", "create_enhanced_analytics_manager"),
-            ("Operational Improvements", "backend.operational_improvements", "create_operational_improvements_system"),
-            ("Smart Automation", "backend.smart_automation", "create_smart_automation_system")
-        ]
-        
-        passed_tests = 0
-        for test_name, module_path, function_name in integration_tests:
-            try:
-                module = __import__(module_path, fromlist=[function_name])
-                func = getattr(module, function_name)
+        # Each import path the frontend will use is checked as its own subtest
+        for test_name, module_path, function_name in FRONTEND_INTEGRATION_POINTS:
+            with self.subTest(test_name):
+                # Probe for the module without executing it; only import what exists
+                if importlib.util.find_spec(module_path) is None:
+                    self.skipTest(f"{test_name} not available (development mode)")
+                try:
+                    module = importlib.import_module(module_path)
+                except ImportError:
+                    self.skipTest(f"{test_name} not available (development mode)")
+                func = getattr(module, function_name, None)
+                if func is None:
+                    self.skipTest(f"{test_name} not available (development mode)")
                 self.assertTrue(callable(func))
-                passed_tests += 1
-                print(f"  ✅ {test_name}: Import ready")
-            except (ImportError, AttributeError):
-                print(f"  ⚠️ {test_name}: Not available (development mode)")
-        
-        if passed_tests > 0:
-            print("✅ Frontend Integration Readiness: PARTIAL (development environment)")
-        else:
-            print("⚠️ Frontend Integration Readiness: Modules need to be completed")
+
+class Phase4TestResult(unittest.TextTestResult):
+    """TextTestResult that keeps outcome counters for the summary report"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.passed_count = 0
+        self.failure_count = 0
+        self.error_count = 0
+        self.skipped_count = 0
+    
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.passed_count += 1
+    
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.failure_count += 1
+    
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.error_count += 1
+    
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self.skipped_count += 1
 
 def run_phase4_tests():
     """Run all Phase 4 tests and generate report"""
@@ -454,21 +458,11 @@ def run_phase4_tests():
     print(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add Phase 4A tests
-    test_suite.addTest(unittest.makeSuite(TestPhase4AEnhancedAnalytics))
-    test_suite.addTest(unittest.makeSuite(TestPhase4AOperationalImprovements))
-    
-    # Add Phase 4B tests
-    test_suite.addTest(unittest.makeSuite(TestPhase4BSmartAutomation))
-    
-    # Add integration tests
-    test_suite.addTest(unittest.makeSuite(TestPhase4Integration))
+    # Collect every test class in this module in one pass
+    test_suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    runner = unittest.TextTestRunner(verbosity=2, resultclass=Phase4TestResult)
     result = runner.run(test_suite)
     
     # Generate summary
@@ -477,10 +471,10 @@ def run_phase4_tests():
     print("="*80)
     
     total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
-    skipped = len(result.skipped) if hasattr(result, 'skipped') else 0
-    passed = total_tests - failures - errors - skipped
+    passed = result.passed_count
+    failures = result.failure_count
+    errors = result.error_count
+    skipped = result.skipped_count
     
     print(f"Total Tests: {total_tests}")
     print(f"✅ Passed: {passed}")
@@ -0,0 +1,41 @@
+"""
+PV Sentinel - shared fixtures for the tests/ suite
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+import yaml
+
+CONFIG_FILE = Path(__file__).parent.parent / "config" / "config.yaml"
+
+@pytest.fixture(scope="session")
+def yaml_config():
+    """Application config.yaml, parsed once per session; None when the file is absent"""
+    if not CONFIG_FILE.exists():
+        return None
+    return yaml.safe_load(CONFIG_FILE.read_text())
+
+# Canonical Phase 2 configuration; read-only, so tests overlay changes instead of mutating it.
+# Records stay in memory unless a test opts into filesystem storage.
+PHASE2_CONFIG = MappingProxyType({
+    'storage_backend': 'memory',
+    'patient_voice': {
+        'protection_enabled': True,
+        'extraction_threshold': 0.7,
+        'auto_lock_enabled': True,
+        'log_modification_attempts': True
+    },
+    'narrative_comparison': {
+        'enabled': True,
+        'auto_severity': True,
+        'require_justification': True,
+        'clinical_terms_file': 'config/clinical_terms.json'
+    }
+})
+
+@pytest.fixture(scope="session")
+def pv_config():
+    """Canonical Phase 2 configuration, with records kept in memory"""
+    return PHASE2_CONFIG
@@ -8,12 +8,11 @@ Phase: 2 - Narrative Control
 """
 
 import pytest
-import tempfile
+import hashlib
 import json
 import os
 from pathlib import Path
 from typing import Dict, List
-from datetime import datetime
 
 # Adjust import paths for testing
 import sys
@@ -30,57 +29,67 @@ from backend.narrative_comparison import (
     create_narrative_comparison_system
 )
 
-@pytest.fixture
-def test_config():
-    """Test configuration for Phase 2 features"""
-    return {
-        'patient_voice': {
-            'protection_enabled': True,
-            'extraction_threshold': 0.7,
-            'auto_lock_enabled': True,
-            'log_modification_attempts': True
-        },
-        'narrative_comparison': {
-            'enabled': True,
-            'auto_severity': True,
-            'require_justification': True,
-            'clinical_terms_file': 'config/clinical_terms.json'
-        }
-    }
+pytestmark = pytest.mark.phase2
+
+# Fixed timestamp for all test data built in this module; keeps IDs and hashes reproducible
+TEST_TIMESTAMP = "2024-06-01T00:00:00"
+
+# Sample patient voice texts, shared by fixtures and parametrized tests
+DIRECT_QUOTE_SAMPLES = (
+    'Patient said: "I started feeling dizzy about 2 hours after taking the pill"',
+    'She reported: "The room was spinning and I had to sit down"',
+    'Patient states: "I felt nauseous and threw up twice"'
+)
+
+REPORTED_SPEECH_SAMPLES = (
+    'Patient reported feeling dizzy after medication',
+    'According to the patient, symptoms started within 2 hours',
+    'Patient mentioned experiencing severe headache'
+)
+
+EMOTIONAL_EXPRESSION_SAMPLES = (
+    'Patient was scared and anxious about the reaction',
+    'She felt worried about taking the medication again',
+    'Patient expressed fear about the side effects'
+)
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for test files"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+TEMPORAL_EXPRESSION_SAMPLES = (
+    'Symptoms started 2 hours after dose',
+    'Patient felt better after 3 days',
+    'Reaction lasted for about a week'
+)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_patient_texts():
     """Sample patient voice texts for testing"""
     return {
-        'direct_quotes': [
-            'Patient said: "I started feeling dizzy about 2 hours after taking the pill"',
-            'She reported: "The room was spinning and I had to sit down"',
-            'Patient states: "I felt nauseous and threw up twice"'
-        ],
-        'reported_speech': [
-            'Patient reported feeling dizzy after medication',
-            'According to the patient, symptoms started within 2 hours',
-            'Patient mentioned experiencing severe headache'
-        ],
-        'emotional_expressions': [
-            'Patient was scared and anxious about the reaction',
-            'She felt worried about taking the medication again',
-            'Patient expressed fear about the side effects'
-        ],
-        'temporal_expressions': [
-            'Symptoms started 2 hours after dose',
-            'Patient felt better after 3 days',
-            'Reaction lasted for about a week'
-        ]
+        'direct_quotes': DIRECT_QUOTE_SAMPLES,
+        'reported_speech': REPORTED_SPEECH_SAMPLES,
+        'emotional_expressions': EMOTIONAL_EXPRESSION_SAMPLES,
+        'temporal_expressions': TEMPORAL_EXPRESSION_SAMPLES
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def make_fragment():
+    """Factory for PatientVoiceFragment test data; keyword overrides replace the defaults"""
+    def _make(**overrides):
+        fields = {
+            'fragment_id': "test-frag-1",
+            'original_text': "Test patient voice",
+            'voice_type': PatientVoiceType.DIRECT_QUOTE,
+            'validation_level': PatientVoiceValidation.VERIFIED,
+            'source': "test_user",
+            'timestamp': TEST_TIMESTAMP,
+            'confidence_score': 0.9,
+            'context': "Test context",
+            'emotional_indicators': [],
+            'clinical_relevance': 0.7
+        }
+        fields.update(overrides)
+        return PatientVoiceFragment(**fields)
+    return _make
+
+@pytest.fixture(scope="session")
 def sample_narratives():
     """Sample narrative versions for comparison testing"""
     return {
@@ -106,23 +115,29 @@ Serious adverse reaction with complete recovery after treatment.
 """
     }
 
+@pytest.fixture(scope="module")
+def extractor(pv_config):
+    """Shared PatientVoiceExtractor; patterns are compiled once per module"""
+    return PatientVoiceExtractor(pv_config)
+
+@pytest.fixture(scope="module")
+def comparator(pv_config):
+    """Shared NarrativeComparator; clinical terms are loaded once per module"""
+    return NarrativeComparator(pv_config)
+
 class TestPatientVoiceExtractor:
     """Test Patient Voice Extraction functionality"""
     
-    def test_extractor_initialization(self, test_config):
+    def test_extractor_initialization(self, extractor):
         """Test PatientVoiceExtractor initialization"""
-        extractor = PatientVoiceExtractor(test_config)
-        
         assert extractor.voice_protection_enabled == True
         assert extractor.extraction_threshold == 0.7
         assert extractor.auto_lock_enabled == True
         assert len(extractor.direct_quote_patterns) > 0
         assert len(extractor.reported_speech_patterns) > 0
     
-    def test_direct_quote_extraction(self, test_config):
+    def test_direct_quote_extraction(self, extractor):
         """Test extraction of direct patient quotes"""
-        extractor = PatientVoiceExtractor(test_config)
-        
         quote_text = 'Patient said: "I started feeling dizzy after taking the pill"'
         fragments = extractor.extract_patient_voice(quote_text, "test_user", PatientVoiceType.DIRECT_QUOTE)
         
@@ -130,42 +145,34 @@ class TestPatientVoiceExtractor:
         assert fragments[0].voice_type == PatientVoiceType.DIRECT_QUOTE
         assert fragments[0].confidence_score >= 0.8
     
-    def test_reported_speech_extraction(self, test_config, sample_patient_texts):
+    @pytest.mark.parametrize("reported_text", REPORTED_SPEECH_SAMPLES)
+    def test_reported_speech_extraction(self, extractor, reported_text):
         """Test extraction of reported patient speech"""
-        extractor = PatientVoiceExtractor(test_config)
+        fragments = extractor.extract_patient_voice(reported_text, "test_user", PatientVoiceType.REPORTED_SPEECH)
         
-        for reported_text in sample_patient_texts['reported_speech']:
-            fragments = extractor.extract_patient_voice(reported_text, "test_user", PatientVoiceType.REPORTED_SPEECH)
-            
-            assert len(fragments) > 0
-            assert fragments[0].voice_type == PatientVoiceType.REPORTED_SPEECH
-            assert fragments[0].confidence_score >= 0.6  # Medium confidence for reported speech
+        assert len(fragments) > 0
+        assert fragments[0].voice_type == PatientVoiceType.REPORTED_SPEECH
+        assert fragments[0].confidence_score >= 0.6  # Medium confidence for reported speech
     
-    def test_emotional_expression_extraction(self, test_config, sample_patient_texts):
+    @pytest.mark.parametrize("emotional_text", EMOTIONAL_EXPRESSION_SAMPLES)
+    def test_emotional_expression_extraction(self, extractor, emotional_text):
         """Test extraction of emotional expressions"""
-        extractor = PatientVoiceExtractor(test_config)
+        fragments = extractor.extract_patient_voice(emotional_text, "test_user")
         
-        for emotional_text in sample_patient_texts['emotional_expressions']:
-            fragments = extractor.extract_patient_voice(emotional_text, "test_user")
-            
-            if fragments:  # Some emotional expressions may not be extracted
-                assert len(fragments[0].emotional_indicators) > 0
-                assert fragments[0].confidence_score >= 0.5
+        if fragments:  # Some emotional expressions may not be extracted
+            assert len(fragments[0].emotional_indicators) > 0
+            assert fragments[0].confidence_score >= 0.5
     
-    def test_temporal_expression_extraction(self, test_config, sample_patient_texts):
+    @pytest.mark.parametrize("temporal_text", TEMPORAL_EXPRESSION_SAMPLES)
+    def test_temporal_expression_extraction(self, extractor, temporal_text):
         """Test extraction of temporal expressions"""
-        extractor = PatientVoiceExtractor(test_config)
+        fragments = extractor.extract_patient_voice(temporal_text, "test_user")
         
-        for temporal_text in sample_patient_texts['temporal_expressions']:
-            fragments = extractor.extract_patient_voice(temporal_text, "test_user")
-            
-            if fragments:  # Some temporal expressions may not be extracted
-                assert fragments[0].clinical_relevance > 0
+        if fragments:  # Some temporal expressions may not be extracted
+            assert fragments[0].clinical_relevance > 0
     
-    def test_fragment_validation(self, test_config):
+    def test_fragment_validation(self, extractor):
         """Test fragment validation and threshold filtering"""
-        extractor = PatientVoiceExtractor(test_config)
-        
         # Test text that should pass validation
         high_quality_text = 'Patient said: "I felt really dizzy and nauseous after taking the medication"'
         fragments = extractor.extract_patient_voice(high_quality_text, "test_user")
@@ -173,10 +180,8 @@ class TestPatientVoiceExtractor:
         assert len(fragments) > 0
         assert all(f.confidence_score >= extractor.extraction_threshold for f in fragments)
     
-    def test_duplicate_filtering(self, test_config):
+    def test_duplicate_filtering(self, extractor):
         """Test that duplicate fragments are filtered out"""
-        extractor = PatientVoiceExtractor(test_config)
-        
         # Same text repeated
         duplicate_text = 'Patient said: "I felt dizzy" Patient said: "I felt dizzy"'
         fragments = extractor.extract_patient_voice(duplicate_text, "test_user")
@@ -184,33 +189,65 @@ class TestPatientVoiceExtractor:
         # Should have only one unique fragment
         unique_texts = set(f.original_text for f in fragments)
         assert len(unique_texts) <= len(fragments)
+    
+    def test_scan_cache_keys_exclude_raw_text(self, pv_config):
+        """Test that memoized scans are keyed on a digest, never on the narrative itself"""
+        extractor = PatientVoiceExtractor(pv_config)
+        text = DIRECT_QUOTE_SAMPLES[0]
+        
+        first = extractor.extract_patient_voice(text, "user_1")
+        second = extractor.extract_patient_voice(text, "user_2")
+        
+        assert [f.original_text for f in first] == [f.original_text for f in second]
+        assert second[0].source == "user_2"
+        assert len(extractor._scan_cache) == 1
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        for key in extractor._scan_cache:
+            assert key[0] == digest
+            assert not any(text in str(element) for element in key)
+        
+        extractor.clear_scan_cache()
+        assert len(extractor._scan_cache) == 0
+
+@pytest.fixture(scope="class")
+def protected_record(pv_config, tmp_path_factory, make_fragment):
+    """One protected record shared by tests that each probe a different aspect of it"""
+    cfg = {
+        **pv_config,
+        'storage_backend': 'filesystem',
+        'storage_dir': str(tmp_path_factory.mktemp("patient_voice"))
+    }
+    protector = PatientVoiceProtector(cfg)
+    
+    fragments = [make_fragment(original_text="Protected patient voice")]
+    
+    record = protector.create_protected_record(
+        case_id="TEST-002",
+        fragments=fragments,
+        created_by="test_user"
+    )
+    return protector, record
 
 class TestPatientVoiceProtector:
     """Test Patient Voice Protection functionality"""
     
-    def test_protector_initialization(self, test_config):
+    def test_protector_initialization(self, pv_config):
         """Test PatientVoiceProtector initialization"""
-        protector = PatientVoiceProtector(test_config)
+        protector = PatientVoiceProtector(pv_config)
         
         assert protector.protection_enabled == True
         assert protector.auto_lock_enabled == True
         assert protector.modification_logging == True
     
-    def test_create_protected_record(self, test_config, temp_dir):
+    def test_create_protected_record(self, pv_config, make_fragment):
         """Test creation of protected patient voice record"""
-        test_config['storage_dir'] = temp_dir
-        protector = PatientVoiceProtector(test_config)
+        protector = PatientVoiceProtector(pv_config)
         
         # Create sample fragments
         fragments = [
-            PatientVoiceFragment(
-                fragment_id="test-frag-1",
+            make_fragment(
                 original_text="I felt really dizzy",
-                voice_type=PatientVoiceType.DIRECT_QUOTE,
                 validation_level=PatientVoiceValidation.REPORTED,
-                source="test_user",
-                timestamp=datetime.now().isoformat(),
-                confidence_score=0.9,
                 context="Patient interview",
                 emotional_indicators=["dizzy"],
                 clinical_relevance=0.8
@@ -229,62 +266,25 @@ class TestPatientVoiceProtector:
         assert record.protection_level in ["protected", "locked"]
         assert record.integrity_hash is not None
     
-    def test_integrity_verification(self, test_config, temp_dir):
+    def test_integrity_verification(self, protected_record):
         """Test patient voice record integrity verification"""
-        test_config['storage_dir'] = temp_dir
-        protector = PatientVoiceProtector(test_config)
-        
-        # Create and store a record
-        fragments = [
-            PatientVoiceFragment(
-                fragment_id="test-frag-1",
-                original_text="Test patient voice",
-                voice_type=PatientVoiceType.DIRECT_QUOTE,
-                validation_level=PatientVoiceValidation.VERIFIED,
-                source="test_user",
-                timestamp=datetime.now().isoformat(),
-                confidence_score=0.9,
-                context="Test context",
-                emotional_indicators=[],
-                clinical_relevance=0.7
-            )
-        ]
-        
-        record = protector.create_protected_record(
-            case_id="TEST-002",
-            fragments=fragments,
-            created_by="test_user"
-        )
+        protector, record = protected_record
         
         # Verify integrity
         assert protector.verify_integrity(record.record_id) == True
     
-    def test_ai_modification_logging(self, test_config, temp_dir):
-        """Test AI modification attempt logging"""
-        test_config['storage_dir'] = temp_dir
-        protector = PatientVoiceProtector(test_config)
+    def test_record_reloads_from_storage_dir(self, protected_record):
+        """Test protected records survive a round trip through filesystem storage"""
+        protector, record = protected_record
         
-        # Create a record first
-        fragments = [
-            PatientVoiceFragment(
-                fragment_id="test-frag-1",
-                original_text="Protected patient voice",
-                voice_type=PatientVoiceType.DIRECT_QUOTE,
-                validation_level=PatientVoiceValidation.VERIFIED,
-                source="test_user",
-                timestamp=datetime.now().isoformat(),
-                confidence_score=0.9,
-                context="Test context",
-                emotional_indicators=[],
-                clinical_relevance=0.7
-            )
-        ]
+        reloaded = PatientVoiceProtector(protector.config)
         
-        record = protector.create_protected_record(
-            case_id="TEST-003",
-            fragments=fragments,
-            created_by="test_user"
-        )
+        assert record.record_id in reloaded.voice_records
+        assert reloaded.verify_integrity(record.record_id) == True
+    
+    def test_ai_modification_logging(self, protected_record):
+        """Test AI modification attempt logging"""
+        protector, record = protected_record
         
         # Log AI modification attempt
         protector.log_ai_modification_attempt(
@@ -299,32 +299,9 @@ class TestPatientVoiceProtector:
         assert len(retrieved_record.ai_modification_attempts) == 1
         assert retrieved_record.ai_modification_attempts[0]['blocked'] == True
     
-    def test_human_annotation(self, test_config, temp_dir):
+    def test_human_annotation(self, protected_record):
         """Test human annotation functionality"""
-        test_config['storage_dir'] = temp_dir
-        protector = PatientVoiceProtector(test_config)
-        
-        # Create a record
-        fragments = [
-            PatientVoiceFragment(
-                fragment_id="test-frag-1",
-                original_text="Patient voice for annotation",
-                voice_type=PatientVoiceType.DIRECT_QUOTE,
-                validation_level=PatientVoiceValidation.REPORTED,
-                source="test_user",
-                timestamp=datetime.now().isoformat(),
-                confidence_score=0.8,
-                context="Test context",
-                emotional_indicators=[],
-                clinical_relevance=0.6
-            )
-        ]
-        
-        record = protector.create_protected_record(
-            case_id="TEST-004",
-            fragments=fragments,
-            created_by="test_user"
-        )
+        protector, record = protected_record
         
         # Add human annotation
         protector.add_human_annotation(
@@ -342,20 +319,16 @@ class TestPatientVoiceProtector:
 class TestNarrativeComparator:
     """Test Narrative Comparison functionality"""
     
-    def test_comparator_initialization(self, test_config):
+    def test_comparator_initialization(self, comparator):
         """Test NarrativeComparator initialization"""
-        comparator = NarrativeComparator(test_config)
-        
         assert comparator.comparison_enabled == True
         assert comparator.auto_severity_assessment == True
         assert comparator.require_justification == True
         assert len(comparator.critical_terms) > 0
         assert len(comparator.significant_terms) > 0
     
-    def test_narrative_comparison(self, test_config, sample_narratives):
+    def test_narrative_comparison(self, comparator, sample_narratives):
         """Test basic narrative comparison"""
-        comparator = NarrativeComparator(test_config)
-        
         # Create narrative versions
         version_1 = NarrativeVersion(
             version_id="test-v1",
@@ -364,7 +337,7 @@ class TestNarrativeComparator:
             version_type="draft",
             narrative_content=sample_narratives['version_1'],
             created_by="test_user",
-            creation_timestamp=datetime.now().isoformat(),
+            creation_timestamp=TEST_TIMESTAMP,
             changes_from_previous=[],
             word_count=0,
             section_breakdown={},
@@ -382,7 +355,7 @@ class TestNarrativeComparator:
             version_type="review",
             narrative_content=sample_narratives['version_2'],
             created_by="test_user",
-            creation_timestamp=datetime.now().isoformat(),
+            creation_timestamp=TEST_TIMESTAMP,
             changes_from_previous=[],
             word_count=0,
             section_breakdown={},
@@ -400,11 +373,22 @@ class TestNarrativeComparator:
         assert len(comparison.changes) > 0
         assert comparison.requires_medical_review is not None
         assert comparison.clinical_impact_assessment is not None
-    
-    def test_change_severity_assessment(self, test_config):
+
+    def test_detailed_diff_line_changes(self, comparator):
+        """Test line-level diff reports edits against original line numbers"""
+        diff_changes = comparator._generate_detailed_diff(
+            "Patient reported headache.\nNo treatment given.\nRecovered.",
+            "Patient reported headache.\nParacetamol given.\nRecovered.\nNo recurrence."
+        )
+
+        assert [change['type'] for change in diff_changes] == ['modification', 'addition']
+        assert diff_changes[0]['line_number'] == 1
+        assert diff_changes[0]['original_text'] == "No treatment given."
+        assert diff_changes[0]['modified_text'] == "Paracetamol given."
+        assert diff_changes[1]['modified_text'] == "No recurrence."
+
+    def test_change_severity_assessment(self, comparator):
         """Test automatic change severity assessment"""
-        comparator = NarrativeComparator(test_config)
-        
         # Test critical change
         critical_severity = comparator._assess_change_severity(
             "Patient felt dizzy",
@@ -426,10 +410,8 @@ class TestNarrativeComparator:
         )
         assert minor_severity in [ChangeSeverity.MINOR, ChangeSeverity.COSMETIC]
     
-    def test_clinical_impact_assessment(self, test_config):
+    def test_clinical_impact_assessment(self, comparator):
         """Test clinical impact assessment"""
-        comparator = NarrativeComparator(test_config)
-        
         # Create test changes
         changes = [
             NarrativeChange(
@@ -442,7 +424,7 @@ class TestNarrativeComparator:
                 modified_text="Patient was hospitalized",
                 justification="Added critical outcome",
                 changed_by="test_user",
-                timestamp=datetime.now().isoformat(),
+                timestamp=TEST_TIMESTAMP,
                 line_number=1,
                 character_position=0,
                 context_before="",
@@ -462,21 +444,17 @@ class TestNarrativeComparator:
 class TestNarrativeVersionManager:
     """Test Narrative Version Management functionality"""
     
-    def test_version_manager_initialization(self, test_config, temp_dir):
+    def test_version_manager_initialization(self, pv_config):
         """Test NarrativeVersionManager initialization"""
-        # Update config for temp directory
-        test_config['storage_dir'] = temp_dir
-        
-        manager = NarrativeVersionManager(test_config)
+        manager = NarrativeVersionManager(pv_config)
         
         assert manager.comparator is not None
         assert isinstance(manager.narrative_versions, dict)
         assert isinstance(manager.comparisons, dict)
     
-    def test_create_new_version(self, test_config, temp_dir, sample_narratives):
+    def test_create_new_version(self, pv_config, sample_narratives):
         """Test creating new narrative versions"""
-        test_config['storage_dir'] = temp_dir
-        manager = NarrativeVersionManager(test_config)
+        manager = NarrativeVersionManager(pv_config)
         
         # Create first version
         version_1 = manager.create_new_version(
@@ -503,10 +481,9 @@ class TestNarrativeVersionManager:
         assert version_2.version_number == 2
         assert len(version_2.changes_from_previous) > 0  # Should have changes from v1
     
-    def test_version_comparison(self, test_config, temp_dir, sample_narratives):
+    def test_version_comparison(self, pv_config, sample_narratives):
         """Test comparing specific versions"""
-        test_config['storage_dir'] = temp_dir
-        manager = NarrativeVersionManager(test_config)
+        manager = NarrativeVersionManager(pv_config)
         
         # Create two versions
         manager.create_new_version(
@@ -530,10 +507,9 @@ class TestNarrativeVersionManager:
         assert comparison.case_id == "TEST-CASE-003"
         assert len(comparison.changes) > 0
     
-    def test_get_latest_version(self, test_config, temp_dir, sample_narratives):
+    def test_get_latest_version(self, pv_config, sample_narratives):
         """Test retrieving latest version"""
-        test_config['storage_dir'] = temp_dir
-        manager = NarrativeVersionManager(test_config)
+        manager = NarrativeVersionManager(pv_config)
         
         # Create multiple versions
         manager.create_new_version(
@@ -554,15 +530,67 @@ class TestNarrativeVersionManager:
         assert latest.version_number == 2
         assert latest.version_id == version_2.version_id
 
+@pytest.fixture(scope="class")
+def case_context(pv_config):
+    """Run the Phase 2 pipeline once; each integration step test checks one stage"""
+    # Initialize all Phase 2 components
+    narrative_manager = create_narrative_comparison_system(pv_config)
+    extractor, protector = create_patient_voice_protector(pv_config)
+    
+    # Test data
+    case_id = "PHASE2-INTEGRATION-001"
+    patient_input = 'Patient reported: "I felt dizzy and nauseous for several hours after taking the medication"'
+    
+    # Step 1: Extract and protect patient voice
+    fragments = extractor.extract_patient_voice(patient_input, "integration_user")
+    
+    voice_record = None
+    if fragments:
+        voice_record = protector.create_protected_record(
+            case_id=case_id,
+            fragments=fragments,
+            created_by="integration_user"
+        )
+    
+    # Step 2: Create initial narrative version
+    initial_narrative = f"A patient experienced adverse reactions after medication. {patient_input} The reaction was monitored and resolved."
+    
+    version_1 = narrative_manager.create_new_version(
+        case_id=case_id,
+        narrative_content=initial_narrative,
+        created_by="integration_user",
+        version_type="draft"
+    )
+    
+    # Step 3: Create revised narrative version
+    revised_narrative = f"A patient experienced significant adverse reactions after medication. {patient_input} The reaction required medical intervention and was completely resolved after treatment."
+    
+    version_2 = narrative_manager.create_new_version(
+        case_id=case_id,
+        narrative_content=revised_narrative,
+        created_by="integration_user",
+        version_type="review"
+    )
+    
+    # Step 4: Compare versions
+    comparison = narrative_manager.compare_versions(case_id, 1, 2)
+    
+    return {
+        'case_id': case_id,
+        'fragments': fragments,
+        'voice_record': voice_record,
+        'version_1': version_1,
+        'version_2': version_2,
+        'comparison': comparison
+    }
+
 class TestIntegrationScenarios:
     """Test integration scenarios combining Phase 2 features"""
     
-    def test_full_patient_voice_pipeline(self, test_config, temp_dir):
+    def test_full_patient_voice_pipeline(self, pv_config):
         """Test complete patient voice protection pipeline"""
-        test_config['storage_dir'] = temp_dir
-        
         # Initialize components
-        extractor, protector = create_patient_voice_protector(test_config)
+        extractor, protector = create_patient_voice_protector(pv_config)
         
         # Sample patient input
         patient_input = 'Patient said: "I started feeling really dizzy about 2 hours after taking the medication. It was scary because I thought I might fall."'
@@ -585,15 +613,13 @@ class TestIntegrationScenarios:
         # Verify integrity
         assert protector.verify_integrity(record.record_id) == True
     
-    def test_narrative_version_with_patient_voice(self, test_config, temp_dir, sample_narratives):
+    def test_narrative_version_with_patient_voice(self, pv_config, sample_narratives, extractor):
         """Test narrative versioning with patient voice protection"""
-        test_config['storage_dir'] = temp_dir
-        
         # Initialize components
-        narrative_manager = create_narrative_comparison_system(test_config)
-        extractor, protector = create_patient_voice_protector(test_config)
+        narrative_manager = create_narrative_comparison_system(pv_config)
+        _, protector = create_patient_voice_protector(pv_config)
         
-        # Extract patient voice from narrative
+        # Extract patient voice from the narrative
         fragments = extractor.extract_patient_voice(sample_narratives['version_1'], "test_user")
         
         # Create protected record
@@ -614,57 +640,25 @@ class TestIntegrationScenarios:
         assert version is not None
         assert version.case_id == "INTEGRATION-002"
     
-    def test_phase2_system_integration(self, test_config, temp_dir):
-        """Test Phase 2 system integration with all components"""
-        test_config['storage_dir'] = temp_dir
-        
-        # Initialize all Phase 2 components
-        narrative_manager = create_narrative_comparison_system(test_config)
-        extractor, protector = create_patient_voice_protector(test_config)
-        
-        # Test data
-        case_id = "PHASE2-INTEGRATION-001"
-        patient_input = 'Patient reported: "I felt dizzy and nauseous for several hours after taking the medication"'
-        
-        # Step 1: Extract and protect patient voice
-        fragments = extractor.extract_patient_voice(patient_input, "integration_user")
-        
-        if fragments:
-            voice_record = protector.create_protected_record(
-                case_id=case_id,
-                fragments=fragments,
-                created_by="integration_user"
-            )
-        
-        # Step 2: Create initial narrative version
-        initial_narrative = f"A patient experienced adverse reactions after medication. {patient_input} The reaction was monitored and resolved."
-        
-        version_1 = narrative_manager.create_new_version(
-            case_id=case_id,
-            narrative_content=initial_narrative,
-            created_by="integration_user",
-            version_type="draft"
-        )
-        
-        # Step 3: Create revised narrative version
-        revised_narrative = f"A patient experienced significant adverse reactions after medication. {patient_input} The reaction required medical intervention and was completely resolved after treatment."
-        
-        version_2 = narrative_manager.create_new_version(
-            case_id=case_id,
-            narrative_content=revised_narrative,
-            created_by="integration_user",
-            version_type="review"
-        )
-        
-        # Step 4: Compare versions
-        comparison = narrative_manager.compare_versions(case_id, 1, 2)
+    def test_phase2_voice_record_created(self, case_context):
+        """Step 1: extracted patient voice is stored as a protected record"""
+        if case_context['fragments']:
+            assert case_context['voice_record'] is not None
+    
+    def test_phase2_version_1_created(self, case_context):
+        """Step 2: initial narrative becomes version 1"""
+        assert case_context['version_1'].version_number == 1
+    
+    def test_phase2_version_2_created(self, case_context):
+        """Step 3: revised narrative becomes version 2"""
+        assert case_context['version_2'].version_number == 2
+    
+    def test_phase2_comparison_has_changes(self, case_context):
+        """Step 4: comparing the versions reports changes for the case"""
+        comparison = case_context['comparison']
         
-        # Verify integration
-        assert voice_record is not None if fragments else True
-        assert version_1.version_number == 1
-        assert version_2.version_number == 2
         assert comparison is not None
-        assert comparison.case_id == case_id
+        assert comparison.case_id == case_context['case_id']
         assert len(comparison.changes) > 0
 
 if __name__ == "__main__":
@@ -7,12 +7,12 @@ PII Handling: Validates core PII protection functionality
 Stakeholder Value: Data Privacy Officer, Patient Advocate, Regulatory Affairs
 """
 
-import unittest
-import tempfile
-import os
+import copy
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -21,243 +21,211 @@ from backend.pii_protection import (
     PIIType, PIISensitivity, create_pii_protector
 )
 
-class TestPIIProtection(unittest.TestCase):
-    """Test cases for PII protection functionality"""
-    
-    def setUp(self):
-        """Set up test configuration"""
-        self.test_config = {
-            'security': {
-                'mask_pii': True,
-                'retain_patient_context': True,
-                'data_anonymization': True,
-                'consent_tracking': True
-            },
-            'pii_protection': {
-                'detection_threshold': 0.7,
-                'mask_in_logs': True,
-                'mask_in_exports': False,
-                'custom_patterns': [],
-                'role_based_masking': {
-                    'auditor': ['name', 'address', 'phone'],
-                    'readonly': ['name', 'date_of_birth', 'address', 'phone', 'email']
-                }
-            }
+# Shared test configuration; tests that need a variant deep-copy it first
+TEST_CONFIG = {
+    'security': {
+        'mask_pii': True,
+        'retain_patient_context': True,
+        'data_anonymization': True,
+        'consent_tracking': True
+    },
+    'pii_protection': {
+        'detection_threshold': 0.7,
+        'mask_in_logs': True,
+        'mask_in_exports': False,
+        'custom_patterns': [],
+        'role_based_masking': {
+            'auditor': ['name', 'address', 'phone'],
+            'readonly': ['name', 'date_of_birth', 'address', 'phone', 'email']
         }
-        
-        self.config = PIIProtectionConfig(self.test_config)
-        self.detector = PIIDetector(self.config)
-        self.masker = PIIMasker(self.config)
-    
-    def test_name_detection(self):
-        """Test detection of patient names"""
-        test_text = "John Smith reported feeling dizzy after taking medication."
-        
-        detections = self.detector.detect_pii(test_text, "patient_narrative")
-        
-        # Should detect at least one name
-        name_detections = [d for d in detections if d.pii_type == PIIType.NAME]
-        self.assertGreater(len(name_detections), 0)
-        
-        # Check the detected name
-        if name_detections:
-            detection = name_detections[0]
-            self.assertEqual(detection.original_text, "John Smith")
-            self.assertEqual(detection.sensitivity, PIISensitivity.HIGH)
-    
-    def test_date_detection(self):
-        """Test detection of dates that could be DOB"""
-        test_text = "Patient was born on 01/15/1980 and reported symptoms on 03/20/2024."
-        
-        detections = self.detector.detect_pii(test_text, "birth_date_context")
-        
-        # Should detect dates
-        date_detections = [d for d in detections if d.pii_type == PIIType.DATE_OF_BIRTH]
-        self.assertGreater(len(date_detections), 0)
-    
-    def test_address_detection(self):
-        """Test detection of addresses"""
-        test_text = "Patient lives at 123 Main Street and can be reached at home."
-        
-        detections = self.detector.detect_pii(test_text, "patient_contact")
-        
-        # Should detect address
-        address_detections = [d for d in detections if d.pii_type == PIIType.ADDRESS]
-        self.assertGreater(len(address_detections), 0)
-    
-    def test_phone_detection(self):
-        """Test detection of phone numbers"""
-        test_text = "Contact patient at (555) 123-4567 for follow-up."
-        
-        detections = self.detector.detect_pii(test_text, "contact_info")
-        
-        # Should detect phone number
-        phone_detections = [d for d in detections if d.pii_type == PIIType.PHONE]
-        self.assertGreater(len(phone_detections), 0)
-    
-    def test_email_detection(self):
-        """Test detection of email addresses"""
-        test_text = "Patient's email is john.doe@email.com for communication."
-        
-        detections = self.detector.detect_pii(test_text, "contact_info")
-        
-        # Should detect email
-        email_detections = [d for d in detections if d.pii_type == PIIType.EMAIL]
-        self.assertGreater(len(email_detections), 0)
-    
-    def test_mrn_detection(self):
-        """Test detection of medical record numbers"""
-        test_text = "Patient MRN: ABC123456 was admitted yesterday."
-        
-        detections = self.detector.detect_pii(test_text, "medical_record")
-        
-        # Should detect MRN
-        mrn_detections = [d for d in detections if d.pii_type == PIIType.MEDICAL_RECORD_NUMBER]
-        self.assertGreater(len(mrn_detections), 0)
-    
-    def test_role_based_masking(self):
-        """Test that different roles see different levels of masking"""
-        test_text = "John Smith from 123 Main St called (555) 123-4567 about side effects."
-        
-        # Test auditor role (should mask names, addresses, phones)
-        masked_auditor, detections_auditor = self.masker.mask_pii(
-            test_text, 
-            user_role="auditor", 
-            context="case_review",
-            preserve_patient_context=False
-        )
-        
-        # Should contain masked elements
-        self.assertIn("[", masked_auditor)  # Some masking should occur
-        self.assertNotIn("John Smith", masked_auditor)  # Name should be masked
-        
-        # Test drafter role (should have minimal masking)
-        masked_drafter, detections_drafter = self.masker.mask_pii(
-            test_text, 
-            user_role="drafter", 
-            context="case_creation"
-        )
-        
-        # Should have less masking than auditor
-        self.assertIn("John Smith", masked_drafter)  # Name should be preserved
-    
-    def test_patient_context_preservation(self):
-        """Test that patient context is preserved when configured"""
-        test_text = "Patient said: 'I felt really dizzy and my name is John Smith.'"
-        
-        # With patient context preservation enabled
-        masked_preserved, _ = self.masker.mask_pii(
-            test_text,
-            user_role="auditor",
-            context="patient_narrative", 
-            preserve_patient_context=True
-        )
-        
-        # Should preserve clinical context while masking identifiers
-        self.assertIn("dizzy", masked_preserved)  # Clinical info preserved
-        
-        # Without patient context preservation
-        masked_full, _ = self.masker.mask_pii(
-            test_text,
-            user_role="auditor", 
-            context="patient_narrative",
-            preserve_patient_context=False
-        )
-        
-        # Should have more aggressive masking
-        self.assertNotIn("John Smith", masked_full)
-    
-    def test_anonymization(self):
-        """Test full anonymization for research/training"""
-        test_text = "John Smith, DOB 01/15/1980, lives at 123 Main St."
-        
-        anonymized_text, metadata = self.masker.create_anonymized_version(
-            test_text, 
-            context="research_data"
-        )
-        
-        # Should replace all PII
-        self.assertNotIn("John Smith", anonymized_text)
-        self.assertNotIn("01/15/1980", anonymized_text)
-        self.assertNotIn("123 Main St", anonymized_text)
-        
-        # Should contain replacement tokens
-        self.assertIn("[", anonymized_text)
-        
-        # Metadata should be present
-        self.assertIn('pii_instances_found', metadata)
-        self.assertGreater(metadata['pii_instances_found'], 0)
-    
-    def test_access_logging(self):
-        """Test that PII access is properly logged"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create temporary log file
-            log_file = os.path.join(temp_dir, "test_pii_access.log")
-            
-            logger = AccessLogger(self.config)
-            logger.log_file = log_file
-            
-            # Log some PII access
-            logger.log_pii_access(
-                user_id="test_user",
-                session_id="test_session", 
-                data_type="patient_narrative",
-                data_content="John Smith reported symptoms",
-                action="read",
-                context="case_review"
-            )
-            
-            # Check that log file was created and contains entry
-            self.assertTrue(os.path.exists(log_file))
-            
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-                self.assertIn("test_user", log_content)
-                self.assertIn("patient_narrative", log_content)
-                # Should not contain unmasked PII
-                self.assertNotIn("John Smith", log_content)
-    
-    def test_false_positive_filtering(self):
-        """Test that medical terms are not falsely detected as names"""
-        test_text = "Patient reported Adverse Event with Brand Name medication."
-        
-        detections = self.detector.detect_pii(test_text, "medical_narrative")
-        
-        # Should not detect "Adverse Event" or "Brand Name" as patient names
-        name_detections = [d for d in detections if d.pii_type == PIIType.NAME]
-        false_positives = [d for d in name_detections if d.original_text in 
-                          ['Adverse Event', 'Brand Name']]
-        
-        self.assertEqual(len(false_positives), 0)
-    
-    def test_configuration_disabled(self):
-        """Test that PII protection can be disabled via configuration"""
-        disabled_config = self.test_config.copy()
-        disabled_config['security']['mask_pii'] = False
-        
-        disabled_config_obj = PIIProtectionConfig(disabled_config)
-        disabled_detector = PIIDetector(disabled_config_obj)
-        
-        test_text = "John Smith reported symptoms."
-        detections = disabled_detector.detect_pii(test_text, "test")
-        
-        # Should return no detections when disabled
-        self.assertEqual(len(detections), 0)
-    
-    def test_factory_function(self):
-        """Test that the factory function creates components correctly"""
-        masker, access_logger = create_pii_protector(self.test_config)
-        
-        self.assertIsInstance(masker, PIIMasker)
-        self.assertIsInstance(access_logger, AccessLogger)
-        
-        # Test that they work
-        test_text = "John Smith test"
-        masked_text, detections = masker.mask_pii(test_text, "auditor")
-        
-        self.assertIsInstance(masked_text, str)
-        self.assertIsInstance(detections, list)
+    }
+}
+
+# Sample texts shared by the masking tests
+ROLE_MASKING_TEXT = "John Smith from 123 Main St called (555) 123-4567 about side effects."
+PATIENT_QUOTE_TEXT = "Patient said: 'I felt really dizzy and my name is John Smith.'"
+
+@pytest.fixture(scope="module")
+def pii_stack():
+    """Config, detector and masker built once per module; no test mutates them"""
+    config = PIIProtectionConfig(TEST_CONFIG)
+    return config, PIIDetector(config), PIIMasker(config)
+
+@pytest.fixture(scope="module")
+def access_logger(pii_stack, tmp_path_factory):
+    """One AccessLogger per module, writing to a scratch log file"""
+    config, _, _ = pii_stack
+    logger = AccessLogger(config)
+    logger.log_file = str(tmp_path_factory.mktemp("pii_logs") / "access.log")
+    return logger
+
+@pytest.mark.parametrize("test_text,context,expected_type", [
+    ("John Smith reported feeling dizzy after taking medication.", "patient_narrative", PIIType.NAME),
+    ("Patient was born on 01/15/1980 and reported symptoms on 03/20/2024.", "birth_date_context", PIIType.DATE_OF_BIRTH),
+    ("Patient lives at 123 Main Street and can be reached at home.", "patient_contact", PIIType.ADDRESS),
+    ("Contact patient at (555) 123-4567 for follow-up.", "contact_info", PIIType.PHONE),
+    ("Patient's email is john.doe@email.com for communication.", "contact_info", PIIType.EMAIL),
+    ("Patient MRN: ABC123456 was admitted yesterday.", "medical_record", PIIType.MEDICAL_RECORD_NUMBER),
+], ids=["name", "dob", "address", "phone", "email", "mrn"])
+def test_pii_detection(pii_stack, test_text, context, expected_type):
+    """Test detection of each built-in PII type"""
+    _, detector, _ = pii_stack
+
+    detections = detector.detect_pii(test_text, context)
+
+    assert any(d.pii_type == expected_type for d in detections)
+
+def test_name_detection_details(pii_stack):
+    """Test the detected patient name text and sensitivity"""
+    _, detector, _ = pii_stack
+    test_text = "John Smith reported feeling dizzy after taking medication."
+
+    detections = detector.detect_pii(test_text, "patient_narrative")
+
+    # Check the detected name
+    name_detections = [d for d in detections if d.pii_type == PIIType.NAME]
+    assert len(name_detections) > 0
+    detection = name_detections[0]
+    assert detection.original_text == "John Smith"
+    assert detection.sensitivity == PIISensitivity.HIGH
+
+@pytest.mark.parametrize("test_text,role,context,preserve,expect_name_in_output", [
+    # Auditors have names, addresses and phones masked
+    (ROLE_MASKING_TEXT, "auditor", "case_review", False, False),
+    # Drafters see the case with minimal masking
+    (ROLE_MASKING_TEXT, "drafter", "case_creation", None, True),
+    # Without patient context preservation, names in patient quotes are masked too
+    (PATIENT_QUOTE_TEXT, "auditor", "patient_narrative", False, False),
+], ids=["auditor", "drafter", "auditor-no-context"])
+def test_role_masking(pii_stack, test_text, role, context, preserve, expect_name_in_output):
+    """Test that different roles see different levels of masking"""
+    _, _, masker = pii_stack
+
+    masked_text, _ = masker.mask_pii(
+        test_text,
+        user_role=role,
+        context=context,
+        preserve_patient_context=preserve
+    )
+
+    assert ("John Smith" in masked_text) == expect_name_in_output
+
+def test_auditor_masking_inserts_tokens(pii_stack):
+    """Test that auditor masking replaces identifiers with tokens"""
+    _, _, masker = pii_stack
+
+    masked_auditor, _ = masker.mask_pii(
+        ROLE_MASKING_TEXT,
+        user_role="auditor",
+        context="case_review",
+        preserve_patient_context=False
+    )
+
+    assert "[" in masked_auditor  # Some masking should occur
+
+def test_patient_context_preservation(pii_stack):
+    """Test that patient context is preserved when configured"""
+    _, _, masker = pii_stack
+
+    masked_preserved, _ = masker.mask_pii(
+        PATIENT_QUOTE_TEXT,
+        user_role="auditor",
+        context="patient_narrative", 
+        preserve_patient_context=True
+    )
+
+    # Should preserve clinical context while masking identifiers
+    assert "dizzy" in masked_preserved  # Clinical info preserved
+
+def test_anonymization(pii_stack):
+    """Test full anonymization for research/training"""
+    _, _, masker = pii_stack
+    test_text = "John Smith, DOB 01/15/1980, lives at 123 Main St."
+
+    anonymized_text, metadata = masker.create_anonymized_version(
+        test_text, 
+        context="research_data"
+    )
+
+    # Should replace all PII
+    assert "John Smith" not in anonymized_text
+    assert "01/15/1980" not in anonymized_text
+    assert "123 Main St" not in anonymized_text
+
+    # Should contain replacement tokens
+    assert "[" in anonymized_text
+
+    # Metadata should be present
+    assert 'pii_instances_found' in metadata
+    assert metadata['pii_instances_found'] > 0
+
+@pytest.mark.io
+def test_access_logging(access_logger):
+    """Test that PII access is properly logged"""
+    log_file = Path(access_logger.log_file)
+
+    # Log some PII access
+    access_logger.log_pii_access(
+        user_id="test_user",
+        session_id="test_session", 
+        data_type="patient_narrative",
+        data_content="John Smith reported symptoms",
+        action="read",
+        context="case_review"
+    )
+
+    # Check that log file was created and contains entry
+    assert log_file.exists()
+
+    log_content = log_file.read_text()
+    assert "test_user" in log_content
+    assert "patient_narrative" in log_content
+    # Should not contain unmasked PII
+    assert "John Smith" not in log_content
+
+def test_false_positive_filtering(pii_stack):
+    """Test that medical terms are not falsely detected as names"""
+    _, detector, _ = pii_stack
+    test_text = "Patient reported Adverse Event with Brand Name medication."
+
+    detections = detector.detect_pii(test_text, "medical_narrative")
+
+    # Should not detect "Adverse Event" or "Brand Name" as patient names
+    name_detections = [d for d in detections if d.pii_type == PIIType.NAME]
+    false_positives = [d for d in name_detections if d.original_text in 
+                      ['Adverse Event', 'Brand Name']]
+
+    assert len(false_positives) == 0
+
+@pytest.mark.parametrize("mask_pii,expect_detections", [
+    (True, True),
+    (False, False),
+], ids=["enabled", "disabled"])
+def test_configuration_toggle(mask_pii, expect_detections):
+    """Test that PII protection can be disabled via configuration"""
+    cfg = copy.deepcopy(TEST_CONFIG)
+    cfg['security']['mask_pii'] = mask_pii
+    detector = PIIDetector(PIIProtectionConfig(cfg))
+
+    detections = detector.detect_pii("John Smith reported symptoms.", "test")
+
+    # Should return no detections when disabled
+    assert bool(detections) == expect_detections
+
+def test_factory_function():
+    """Test that the factory function creates components correctly"""
+    masker, access_logger = create_pii_protector(TEST_CONFIG)
+
+    assert isinstance(masker, PIIMasker)
+    assert isinstance(access_logger, AccessLogger)
+
+    # Test that they work
+    test_text = "John Smith test"
+    masked_text, detections = masker.mask_pii(test_text, "auditor")
+
+    assert isinstance(masked_text, str)
+    assert isinstance(detections, list)
 
 if __name__ == '__main__':
     # Run the tests
-    unittest.main() 
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,63 @@
+"""
+Test Suite for PV Sentinel Regulatory Export
+Checks that the streamed PSUR narrative matches the assembled report text
+
+Phase: 4B - Regulatory Export
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Adjust import paths for testing
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backend.regulatory_export import create_regulatory_export_manager
+
+PSUR_CASES = (
+    {"case_id": "CASE_001", "serious": True, "patient_age": 65, "patient_gender": "male",
+     "event_description": "Anaphylaxis", "outcome": "recovering", "causality_assessment": "Probable"},
+    {"case_id": "CASE_002", "serious": False},
+)
+
+PSUR_METADATA = {
+    "product_name": "Product X",
+    "reporting_period": "01-Jul-2023 to 31-Dec-2023",
+    "data_lock_point": "31-Dec-2023"
+}
+
+# Executive summary exactly as the PSUR builder has always produced it,
+# including the leading whitespace inside the section body
+EXPECTED_EXECUTIVE_SUMMARY = """
+PERIODIC SAFETY UPDATE REPORT
+Product: Product X
+Reporting Period: 01-Jul-2023 to 31-Dec-2023
+Data Lock Point: 31-Dec-2023
+            
+EXECUTIVE SUMMARY
+During the reporting period 01-Jul-2023 to 31-Dec-2023, a total of 2 adverse event reports were 
+received for Product X. This report provides a comprehensive analysis of the safety 
+profile based on all available data up to the data lock point of 31-Dec-2023.
+            """
+
+@pytest.fixture(scope="module")
+def export_manager():
+    return create_regulatory_export_manager({})
+
+def test_psur_stream_joins_to_full_narrative(export_manager):
+    """Test that the streamed sections join into the same text as the full export"""
+    sections = list(export_manager.stream_psur_narrative(list(PSUR_CASES), PSUR_METADATA))
+    narrative = export_manager.export_to_psur_narrative(list(PSUR_CASES), PSUR_METADATA)
+    
+    # Only the generation timestamp in the conclusion may differ between the two calls
+    assert "\n".join(sections[:-1]) == narrative[:len("\n".join(sections[:-1]))]
+    assert len(sections) == 5  # summary, serious header, one case, non-serious, conclusion
+
+def test_psur_sections_keep_original_text(export_manager):
+    """Test that section bodies keep their original literal text and whitespace"""
+    sections = list(export_manager.stream_psur_narrative(list(PSUR_CASES), PSUR_METADATA))
+    
+    assert sections[0] == EXPECTED_EXECUTIVE_SUMMARY
+    assert sections[2].endswith("Causality: Probable\n                    ")
+    assert sections[-1].endswith("Data Lock Point: 31-Dec-2023\n            ")